@@ -11,7 +11,7 @@ This module provides:
 
 from .vector_store import LocalVectorStore, get_vector_store
 from .document_processor import DocumentProcessor, save_uploaded_file
-from .adk_tool import LocalRagRetrieval, get_local_rag_tool
+from .adk_tool import LocalRagRetrieval, get_local_rag_tool, get_local_rag_batch_tool
 
 __all__ = [
     'LocalVectorStore',
@@ -19,5 +19,6 @@ __all__ = [
     'DocumentProcessor',
     'save_uploaded_file',
     'LocalRagRetrieval',
-    'get_local_rag_tool'
+    'get_local_rag_tool',
+    'get_local_rag_batch_tool'
 ]
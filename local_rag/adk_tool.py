@@ -2,7 +2,8 @@
 Local RAG Retrieval Tool for Google ADK
 Replaces VertexAiRagRetrieval with local ChromaDB implementation
 """
-from typing import Any, Dict, List
+import functools
+from typing import Any, Dict, List, Tuple
 from local_rag import get_vector_store
 
 
@@ -10,6 +11,48 @@ from local_rag import get_vector_store
 _vector_store = None
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_retrieval(
+    data_version: int,
+    collection_count: int,
+    collection_name: str,
+    query: str,
+    n_results: int,
+    min_similarity: float
+) -> Tuple[Tuple[str, Dict[str, Any], float, float], ...]:
+    """
+    Query the vector store, memoized per query and store contents
+    
+    Failed queries raise instead of returning, so they are never cached.
+    
+    Args:
+        data_version: Vector store data version (invalidates entries on writes)
+        collection_count: Documents in the collection (invalidates entries on
+            writes made through other LocalVectorStore instances)
+        collection_name: ChromaDB collection name
+        query: The search query
+        n_results: Number of results to return
+        min_similarity: Minimum similarity threshold (0-1)
+        
+    Returns:
+        Tuple of (document, metadata, distance, similarity) tuples
+    """
+    results = _vector_store.query(
+        query_text=query,
+        n_results=n_results,
+        collection_name=collection_name,
+        min_similarity=min_similarity
+    )
+    if 'error' in results:
+        raise RuntimeError(results['error'])
+    return tuple(zip(
+        results.get('documents', []),
+        results.get('metadatas', []),
+        results.get('distances', []),
+        results.get('similarities', [])
+    ))
+
+
 def get_local_rag_tool(
     collection_name: str = "resumes",
     similarity_top_k: int = 10,
@@ -42,26 +85,25 @@ def get_local_rag_tool(
             List of relevant documents with content, metadata, and similarity scores
         """
         try:
-            # Query the vector store
-            results = _vector_store.query(
-                query_text=query,
-                n_results=similarity_top_k,
-                collection_name=collection_name,
-                min_similarity=vector_distance_threshold
+            # Query the vector store (repeat queries skip the embedding step)
+            results = _cached_retrieval(
+                _vector_store.data_version,
+                _vector_store.get_collection_count(collection_name),
+                collection_name,
+                query,
+                similarity_top_k,
+                vector_distance_threshold
             )
             
-            # Format results for ADK agents
+            # Format results for ADK agents (metadata is copied so callers
+            # cannot modify the cached entries)
             formatted_results = []
-            for doc, metadata, distance in zip(
-                results.get('documents', []),
-                results.get('metadatas', []),
-                results.get('distances', [])
-            ):
+            for doc, metadata, distance, similarity in results:
                 formatted_results.append({
                     'content': doc,
-                    'metadata': metadata,
+                    'metadata': dict(metadata) if metadata else metadata,
                     'distance': distance,
-                    'similarity': 1 / (1 + distance)  # Convert distance to similarity score
+                    'similarity': similarity
                 })
             
             print(f"🔍 Retrieved {len(formatted_results)} documents for query: '{query[:50]}...'")
@@ -74,6 +116,73 @@ def get_local_rag_tool(
     return local_rag_retrieval
 
 
+def get_local_rag_batch_tool(
+    collection_name: str = "resumes",
+    similarity_top_k: int = 10,
+    vector_distance_threshold: float = 0.5
+):
+    """
+    Create a batched local RAG retrieval tool function for Google ADK
+    
+    Args:
+        collection_name: ChromaDB collection name
+        similarity_top_k: Number of results to return per query
+        vector_distance_threshold: Minimum similarity threshold (0-1)
+        
+    Returns:
+        A callable tool function compatible with Google ADK
+    """
+    global _vector_store
+    if _vector_store is None:
+        _vector_store = get_vector_store()
+    
+    def local_rag_retrieval_batch(queries: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve relevant information for several queries at once from the local vector database.
+        Use this tool when multiple searches are needed; the queries are embedded together.
+        
+        Args:
+            queries: The search queries to find relevant documents for
+            
+        Returns:
+            One list of relevant documents (content, metadata, similarity) per query
+        """
+        try:
+            batch_results = _vector_store.query_batch(
+                query_texts=queries,
+                n_results=similarity_top_k,
+                collection_name=collection_name,
+                min_similarity=vector_distance_threshold
+            )
+            
+            # Format results for ADK agents
+            formatted_batch = []
+            for results in batch_results:
+                formatted_batch.append([
+                    {
+                        'content': doc,
+                        'metadata': metadata,
+                        'distance': distance,
+                        'similarity': similarity
+                    }
+                    for doc, metadata, distance, similarity in zip(
+                        results.get('documents', []),
+                        results.get('metadatas', []),
+                        results.get('distances', []),
+                        results.get('similarities', [])
+                    )
+                ])
+            
+            print(f"🔍 Retrieved documents for {len(queries)} queries")
+            return formatted_batch
+            
+        except Exception as e:
+            print(f"❌ Error in batch retrieval: {e}")
+            return [[] for _ in queries]
+    
+    return local_rag_retrieval_batch
+
+
 # For backward compatibility, create a class wrapper
 class LocalRagRetrieval:
     """
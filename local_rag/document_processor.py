@@ -3,26 +3,133 @@ Document Processing for Local RAG
 Handles PDF parsing, text extraction, and chunking
 """
 import os
+import re
+import json
+import multiprocessing
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 import hashlib
 import PyPDF2
 from io import BytesIO
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # PyPDF2 remains available as the pure-Python backend
+    pdfium = None
+
+# Characters not allowed in saved upload filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w.\- ]')
+
+# Characters that end a sentence/line and make a good chunk boundary
+_BOUNDARY_CHARS = '.?!\n'
+
+# Part of the chunk cache key: bump the number whenever text extraction or
+# chunking changes so chunks cached by older code are never served
+_EXTRACTOR_VERSION = f"1-{'pdfium' if pdfium is not None else 'pypdf2'}"
+
+
+def _find_break(text: str, lo: int, hi: int) -> int:
+    """
+    Find the last chunk boundary character in text[lo:hi]
+    
+    Uses C-level str.rfind on the original string (no slicing) instead of
+    a per-character Python loop.
+    
+    Args:
+        text: Full text being chunked
+        lo: Start of the search window (inclusive)
+        hi: End of the search window (exclusive)
+        
+    Returns:
+        Index of the boundary character, or -1 if none
+    """
+    return max(text.rfind(c, lo, hi) for c in _BOUNDARY_CHARS)
+
 
 class DocumentProcessor:
     """Process documents (PDFs) for vector storage"""
     
-    def __init__(self, chunk_size: int = 1000, chunk_overlap: int = 200):
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize document processor
         
         Args:
             chunk_size: Size of text chunks in characters
             chunk_overlap: Overlap between chunks in characters
+            cache_path: SQLite file caching chunks per PDF content hash
+                (None, the default, disables the cache)
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        
+        # Only the path is kept (not a connection) so the processor stays picklable
+        self._file_cache = cache_path
+        if cache_path:
+            Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(cache_path) as conn:
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS file_chunks (
+                        file_hash TEXT NOT NULL,
+                        extractor TEXT NOT NULL,
+                        chunk_size INTEGER NOT NULL,
+                        chunk_overlap INTEGER NOT NULL,
+                        filename TEXT,
+                        chunks TEXT NOT NULL,
+                        PRIMARY KEY (file_hash, extractor, chunk_size, chunk_overlap)
+                    )"""
+                )
+            conn.close()
+    
+    def _cached_chunks(self, file_hash: str) -> Optional[List[str]]:
+        """
+        Look up chunks for a PDF already processed with the current settings
+        and extractor version
+        
+        Args:
+            file_hash: Content hash of the PDF bytes
+            
+        Returns:
+            Cached chunks, or None on a miss
+        """
+        try:
+            with sqlite3.connect(self._file_cache, timeout=30) as conn:
+                row = conn.execute(
+                    "SELECT chunks FROM file_chunks "
+                    "WHERE file_hash = ? AND extractor = ? AND chunk_size = ? AND chunk_overlap = ?",
+                    (file_hash, _EXTRACTOR_VERSION, self.chunk_size, self.chunk_overlap)
+                ).fetchone()
+            conn.close()
+            return json.loads(row[0]) if row else None
+        except Exception as e:
+            print(f"⚠️ Document cache lookup failed: {e}")
+            return None
+    
+    def _store_chunks(self, file_hash: str, filename: str, chunks: List[str]):
+        """
+        Record the chunks produced for a PDF
+        
+        Args:
+            file_hash: Content hash of the PDF bytes
+            filename: Name of the file
+            chunks: Text chunks extracted from it
+        """
+        try:
+            with sqlite3.connect(self._file_cache, timeout=30) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO file_chunks VALUES (?, ?, ?, ?, ?, ?)",
+                    (file_hash, _EXTRACTOR_VERSION, self.chunk_size, self.chunk_overlap,
+                     filename, json.dumps(chunks))
+                )
+            conn.close()
+        except Exception as e:
+            print(f"⚠️ Document cache write failed: {e}")
     
     def extract_text_from_pdf(self, pdf_file) -> str:
         """
@@ -34,27 +141,70 @@ class DocumentProcessor:
         Returns:
             Extracted text
         """
+        if pdfium is not None:
+            try:
+                return self._extract_text_pdfium(pdf_file)
+            except Exception as e:
+                print(f"⚠️ pdfium extraction failed, falling back to PyPDF2: {e}")
+                if hasattr(pdf_file, 'seek'):
+                    pdf_file.seek(0)
+        
         try:
             # Handle both file paths and file objects
             if isinstance(pdf_file, (str, Path)):
                 with open(pdf_file, 'rb') as f:
-                    pdf_reader = PyPDF2.PdfReader(f)
-                    text = ""
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
+                    return self._extract_text_pypdf2(f)
             else:
                 # File object (e.g., from Streamlit upload)
-                pdf_reader = PyPDF2.PdfReader(pdf_file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-            
-            return text.strip()
+                return self._extract_text_pypdf2(pdf_file)
             
         except Exception as e:
             print(f"❌ Error extracting text from PDF: {e}")
             return ""
     
+    def _extract_text_pypdf2(self, stream) -> str:
+        """
+        Extract text using the pure-Python PyPDF2 backend
+        
+        Args:
+            stream: Binary file object positioned at the start of the PDF
+            
+        Returns:
+            Extracted text
+        """
+        pdf_reader = PyPDF2.PdfReader(stream)
+        pages = [page.extract_text() or "" for page in pdf_reader.pages]
+        return "\n".join(pages).strip()
+    
+    def _extract_text_pdfium(self, pdf_file) -> str:
+        """
+        Extract text using the PDFium (C++) backend
+        
+        Args:
+            pdf_file: File object or path to PDF
+            
+        Returns:
+            Extracted text
+        """
+        if isinstance(pdf_file, (str, Path)):
+            pdf = pdfium.PdfDocument(str(pdf_file))
+        else:
+            # File object (e.g., from Streamlit upload) - hand PDFium the raw bytes
+            data = pdf_file.getvalue() if hasattr(pdf_file, 'getvalue') else pdf_file.read()
+            pdf = pdfium.PdfDocument(data)
+        
+        pages = []
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                pages.append(textpage.get_text_range())
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+        
+        return "\n".join(pages).strip()
+    
     def chunk_text(self, text: str) -> List[str]:
         """
         Split text into overlapping chunks
@@ -68,27 +218,25 @@ class DocumentProcessor:
         if not text:
             return []
         
-        chunks = []
+        # First pass: compute (start, end) offsets without copying any text
+        spans = []
         start = 0
         text_length = len(text)
         
         while start < text_length:
             end = start + self.chunk_size
-            chunk = text[start:end]
             
-            # Try to break at sentence boundary
+            # Try to break at sentence boundary in the back half of the window
             if end < text_length:
-                last_period = chunk.rfind('.')
-                last_newline = chunk.rfind('\n')
-                break_point = max(last_period, last_newline)
-                
-                if break_point > self.chunk_size // 2:
-                    chunk = chunk[:break_point + 1]
-                    end = start + break_point + 1
-            
-            chunks.append(chunk.strip())
+                break_point = _find_break(text, start + self.chunk_size // 2 + 1, end)
+                if break_point != -1:
+                    end = break_point + 1
+            
+            spans.append((start, end))
             start = end - self.chunk_overlap
         
+        # Second pass: materialize each chunk once
+        chunks = (text[s:e].strip() for s, e in spans)
         return [c for c in chunks if c]  # Filter empty chunks
     
     def process_pdf(
@@ -108,15 +256,36 @@ class DocumentProcessor:
         Returns:
             Tuple of (chunks, metadata_list)
         """
-        # Extract text
-        text = self.extract_text_from_pdf(pdf_file)
-        
-        if not text:
-            print(f"⚠️ No text extracted from {filename}")
-            return [], []
+        chunks = None
+        file_hash = None
+        if self._file_cache:
+            # Hash the raw bytes so re-uploads of the same PDF skip parsing entirely
+            if isinstance(pdf_file, (str, Path)):
+                with open(pdf_file, 'rb') as f:
+                    data = f.read()
+            else:
+                data = pdf_file.getvalue() if hasattr(pdf_file, 'getvalue') else pdf_file.read()
+            pdf_file = BytesIO(data)
+            file_hash = hashlib.blake2b(data).hexdigest()
+            chunks = self._cached_chunks(file_hash)
         
-        # Chunk text
-        chunks = self.chunk_text(text)
+        if chunks is None:
+            # Extract text
+            text = self.extract_text_from_pdf(pdf_file)
+            
+            if not text:
+                print(f"⚠️ No text extracted from {filename}")
+                return [], []
+            
+            # Chunk text
+            chunks = self.chunk_text(text)
+            
+            if file_hash:
+                self._store_chunks(file_hash, filename, chunks)
+            
+            print(f"✅ Processed {filename}: {len(chunks)} chunks from {len(text)} characters")
+        else:
+            print(f"✅ Processed {filename}: {len(chunks)} chunks (cached)")
         
         # Create metadata for each chunk
         metadatas = []
@@ -135,7 +304,6 @@ class DocumentProcessor:
             
             metadatas.append(metadata)
         
-        print(f"✅ Processed {filename}: {len(chunks)} chunks from {len(text)} characters")
         return chunks, metadatas
     
     def process_multiple_pdfs(
@@ -156,8 +324,35 @@ class DocumentProcessor:
         all_chunks = []
         all_metadata = []
         
-        for pdf_file, filename in zip(pdf_files, filenames):
-            chunks, metadata = self.process_pdf(pdf_file, filename)
+        jobs = list(zip(pdf_files, filenames))
+        
+        if len(jobs) <= 1:
+            results = [self.process_pdf(pdf_file, filename) for pdf_file, filename in jobs]
+        else:
+            # PDF parsing is CPU-bound, so spread files across processes, spawned
+            # rather than forked from the multithreaded Streamlit process.
+            # Upload handles can't be pickled - read them here and ship the bytes.
+            jobs = [
+                (pdf_file if isinstance(pdf_file, (str, Path)) else BytesIO(
+                    pdf_file.getvalue() if hasattr(pdf_file, 'getvalue') else pdf_file.read()
+                ), filename)
+                for pdf_file, filename in jobs
+            ]
+            results = [None] * len(jobs)
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                futures = {
+                    executor.submit(self.process_pdf, pdf_file, filename): i
+                    for i, (pdf_file, filename) in enumerate(jobs)
+                }
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        
+        # Keep output in submission order
+        for chunks, metadata in results:
             all_chunks.extend(chunks)
             all_metadata.extend(metadata)
         
@@ -180,15 +375,18 @@ def save_uploaded_file(uploaded_file, upload_dir: str = "./data/uploads") -> str
         Path(upload_dir).mkdir(parents=True, exist_ok=True)
         
         # Sanitize filename
-        safe_filename = "".join(c if c.isalnum() or c in ['.', '_', '-', ' '] else '_' for c in uploaded_file.name)
+        safe_filename = _UNSAFE_FILENAME_CHARS.sub('_', uploaded_file.name)
         
-        # Generate unique filename if file already exists
-        file_path = Path(upload_dir) / safe_filename
+        # Generate unique filename if file already exists (one directory listing)
+        with os.scandir(upload_dir) as entries:
+            existing = {entry.name for entry in entries}
+        name, ext = os.path.splitext(safe_filename)
+        candidate = safe_filename
         counter = 1
-        while file_path.exists():
-            name, ext = os.path.splitext(safe_filename)
-            file_path = Path(upload_dir) / f"{name}_{counter}{ext}"
+        while candidate in existing:
+            candidate = f"{name}_{counter}{ext}"
             counter += 1
+        file_path = Path(upload_dir) / candidate
         
         # Save file
         with open(file_path, 'wb') as f:
@@ -4,25 +4,98 @@ Replaces VertexAI RAG with local storage
 """
 import os
 import chromadb
+import numpy as np
 from chromadb.config import Settings
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 import hashlib
 from pathlib import Path
 
+try:
+    import simsimd
+except ImportError:  # fall back to NumPy for re-ranking
+    simsimd = None
+
+# Candidates fetched from the HNSW index per requested result when re-ranking
+RERANK_CANDIDATE_FACTOR = 4
+
+
+def _document_id(doc: str) -> str:
+    """
+    Content-derived ID for a document chunk (dedup key, not a security hash)
+    
+    Always stdlib BLAKE2b, so the persisted IDs do not depend on which
+    optional packages are installed.
+    
+    Args:
+        doc: Document text
+        
+    Returns:
+        32-character hex digest
+    """
+    return hashlib.blake2b(doc.encode('utf-8'), digest_size=16).hexdigest()
+
+
+# Loaded SentenceTransformer models by name (shared across stores, loaded once)
+_embedding_models: Dict[str, Any] = {}
+
+
+def _get_embedding_model(model_name: str):
+    """
+    Get a shared SentenceTransformer instance, loading it on first use
+    
+    Args:
+        model_name: SentenceTransformer model name (e.g. "all-MiniLM-L6-v2")
+        
+    Returns:
+        SentenceTransformer model (on GPU when one is available)
+    """
+    model = _embedding_models.get(model_name)
+    if model is None:
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(model_name)
+        _embedding_models[model_name] = model
+    return model
+
+
+# HNSW index configuration for new collections. Cosine space suits normalized
+# text embeddings; existing collections keep their original space, so
+# delete_collection() and re-index to pick these up.
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+    "hnsw:search_ef": 100
+}
+
 
 class LocalVectorStore:
     """Local vector database using ChromaDB for resume indexing"""
     
-    def __init__(self, persist_directory: str = "./data/vector_db"):
+    def __init__(
+        self,
+        persist_directory: str = "./data/vector_db",
+        embedding_model: Optional[str] = None
+    ):
         """
         Initialize ChromaDB client with local persistence
         
         Args:
             persist_directory: Path to store vector database
+            embedding_model: SentenceTransformer model used to embed documents and
+                queries in batches outside Chroma (None keeps Chroma's embedder)
         """
         self.persist_directory = persist_directory
+        self.embedding_model = embedding_model
         Path(persist_directory).mkdir(parents=True, exist_ok=True)
         
+        # Bumped whenever stored documents change; lets callers key caches on it
+        self.data_version = 0
+        
+        # Collection handles by name, so hot paths skip Chroma's metadata lookup
+        self._collections = {}
+        # Distance space ('cosine', 'l2' or 'ip') of each cached collection
+        self._spaces = {}
+        
         # Initialize ChromaDB with persistence
         self.client = chromadb.PersistentClient(
             path=persist_directory,
@@ -32,6 +105,25 @@ class LocalVectorStore:
             )
         )
         
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts with the configured SentenceTransformer in one batched call
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            Normalized float32 embeddings, one row per text
+        """
+        model = _get_embedding_model(self.embedding_model)
+        return model.encode(
+            texts,
+            batch_size=64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+    
     def get_or_create_collection(self, collection_name: str = "resumes"):
         """
         Get or create a ChromaDB collection
@@ -42,11 +134,21 @@ class LocalVectorStore:
         Returns:
             ChromaDB collection
         """
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            return collection
+        
         try:
             collection = self.client.get_or_create_collection(
                 name=collection_name,
-                metadata={"description": "Resume documents collection"}
+                metadata={"description": "Resume documents collection", **HNSW_METADATA}
             )
+            space = (collection.metadata or {}).get("hnsw:space", "l2")
+            if space != HNSW_METADATA["hnsw:space"]:
+                print(f"⚠️ Collection '{collection_name}' uses '{space}' distance; "
+                      f"delete and re-index it to switch to cosine similarity")
+            self._collections[collection_name] = collection
+            self._spaces[collection_name] = space
             return collection
         except Exception as e:
             print(f"Error creating collection: {e}")
@@ -56,7 +158,8 @@ class LocalVectorStore:
         self, 
         documents: List[str], 
         metadatas: List[Dict[str, Any]], 
-        collection_name: str = "resumes"
+        collection_name: str = "resumes",
+        embeddings: Optional[Sequence[Sequence[float]]] = None
     ) -> bool:
         """
         Add documents to the vector store
@@ -65,6 +168,8 @@ class LocalVectorStore:
             documents: List of document texts
             metadatas: List of metadata dicts for each document
             collection_name: Name of collection to add to
+            embeddings: Precomputed embeddings, one row per document
+                (normalized before storing; Chroma embeds documents if omitted)
             
         Returns:
             Success status
@@ -73,16 +178,44 @@ class LocalVectorStore:
             collection = self.get_or_create_collection(collection_name)
             
             # Generate unique IDs for documents
-            ids = [hashlib.md5(doc.encode()).hexdigest() for doc in documents]
+            ids = [_document_id(doc) for doc in documents]
+            
+            # Skip chunks already indexed (re-uploads) and duplicates within this batch
+            seen = set(collection.get(ids=ids, include=[])['ids'])
+            keep = []
+            for i, doc_id in enumerate(ids):
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                keep.append(i)
+            
+            new_ids = [ids[i] for i in keep]
+            if not new_ids:
+                print(f"ℹ️ All {len(documents)} documents already in collection '{collection_name}'")
+                return True
+            
+            add_kwargs = {
+                'documents': [documents[i] for i in keep],
+                'metadatas': [metadatas[i] for i in keep],
+                'ids': new_ids
+            }
+            
+            if embeddings is not None:
+                # Unit-length vectors make cosine distance a plain dot product
+                vectors = np.asarray(embeddings, dtype=np.float32)[keep]
+                norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+                vectors /= np.maximum(norms, 1e-12)
+                add_kwargs['embeddings'] = vectors.tolist()
+            elif self.embedding_model:
+                # Embed only the new chunks, batched, instead of Chroma embedding on add
+                add_kwargs['embeddings'] = self._embed(add_kwargs['documents']).tolist()
             
             # Add documents to collection
-            collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
+            collection.add(**add_kwargs)
+            self.data_version += 1
             
-            print(f"✅ Added {len(documents)} documents to collection '{collection_name}'")
+            print(f"✅ Added {len(new_ids)} documents to collection '{collection_name}' "
+                  f"({len(documents) - len(new_ids)} already present)")
             return True
             
         except Exception as e:
@@ -94,7 +227,8 @@ class LocalVectorStore:
         query_text: str, 
         n_results: int = 10, 
         collection_name: str = "resumes",
-        min_similarity: float = 0.5
+        min_similarity: float = 0.5,
+        query_embedding: Optional[Sequence[float]] = None
     ) -> Dict[str, Any]:
         """
         Query the vector store
@@ -104,49 +238,191 @@ class LocalVectorStore:
             n_results: Number of results to return
             collection_name: Name of collection to query
             min_similarity: Minimum similarity threshold (0-1)
+            query_embedding: Precomputed query vector; when given, an enlarged
+                candidate set is fetched and re-ranked exactly in-process
             
         Returns:
-            Query results with documents and metadata
+            Query results with documents, metadata, distances and similarities
+            (on failure the lists are empty and an 'error' message is set)
         """
         try:
             collection = self.get_or_create_collection(collection_name)
+            space = self._spaces[collection_name]
             
-            results = collection.query(
-                query_texts=[query_text],
-                n_results=n_results
-            )
+            if query_embedding is None and self.embedding_model:
+                query_embedding = self._embed([query_text])[0]
             
-            # Filter by similarity threshold (ChromaDB returns distances, lower is better)
-            # Convert distance to similarity (1 - normalized_distance)
-            filtered_results = {
-                'documents': [],
-                'metadatas': [],
-                'distances': [],
-                'ids': []
-            }
+            if query_embedding is None:
+                results = collection.query(
+                    query_texts=[query_text],
+                    n_results=n_results
+                )
+            else:
+                results = collection.query(
+                    query_embeddings=[np.asarray(query_embedding, dtype=np.float32).tolist()],
+                    n_results=n_results * RERANK_CANDIDATE_FACTOR,
+                    include=['documents', 'metadatas', 'distances', 'embeddings']
+                )
+                if results['ids'] and len(results['ids'][0]) > 0:
+                    top, distances = self._rerank(
+                        np.asarray(query_embedding, dtype=np.float32),
+                        np.asarray(results['embeddings'][0], dtype=np.float32),
+                        n_results
+                    )
+                    results = {
+                        'documents': [[results['documents'][0][i] for i in top]],
+                        'metadatas': [[results['metadatas'][0][i] for i in top]],
+                        'distances': [distances.tolist()],
+                        'ids': [[results['ids'][0][i] for i in top]]
+                    }
+                # Re-ranked distances are cosine whatever the collection's space
+                space = "cosine"
             
-            if results['documents'] and results['documents'][0]:
-                for i, (doc, metadata, distance, doc_id) in enumerate(zip(
-                    results['documents'][0],
-                    results['metadatas'][0],
-                    results['distances'][0],
-                    results['ids'][0]
-                )):
-                    # ChromaDB uses L2 distance, convert to similarity
-                    similarity = 1 / (1 + distance)
-                    
-                    if similarity >= min_similarity:
-                        filtered_results['documents'].append(doc)
-                        filtered_results['metadatas'].append(metadata)
-                        filtered_results['distances'].append(distance)
-                        filtered_results['ids'].append(doc_id)
+            filtered_results = self._filter_results(results, 0, min_similarity, space)
             
             print(f"✅ Found {len(filtered_results['documents'])} results above similarity threshold {min_similarity}")
             return filtered_results
             
         except Exception as e:
             print(f"❌ Error querying: {e}")
-            return {'documents': [], 'metadatas': [], 'distances': [], 'ids': []}
+            return {'documents': [], 'metadatas': [], 'distances': [], 'similarities': [], 'ids': [], 'error': str(e)}
+    
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 10,
+        collection_name: str = "resumes",
+        min_similarity: float = 0.5
+    ) -> List[Dict[str, Any]]:
+        """
+        Query the vector store with several queries in one call
+        
+        All queries are embedded together, amortizing the embedding model
+        overhead across the batch.
+        
+        Args:
+            query_texts: Query strings
+            n_results: Number of results to return per query
+            collection_name: Name of collection to query
+            min_similarity: Minimum similarity threshold (0-1)
+            
+        Returns:
+            One result dict per query, in the same shape as query()
+        """
+        if not query_texts:
+            return []
+        
+        try:
+            collection = self.get_or_create_collection(collection_name)
+            space = self._spaces[collection_name]
+            
+            if self.embedding_model:
+                results = collection.query(
+                    query_embeddings=self._embed(query_texts).tolist(),
+                    n_results=n_results
+                )
+            else:
+                results = collection.query(
+                    query_texts=query_texts,
+                    n_results=n_results
+                )
+            
+            filtered = [
+                self._filter_results(results, q, min_similarity, space)
+                for q in range(len(query_texts))
+            ]
+            
+            print(f"✅ Ran {len(query_texts)} queries above similarity threshold {min_similarity}")
+            return filtered
+            
+        except Exception as e:
+            print(f"❌ Error querying: {e}")
+            return [
+                {'documents': [], 'metadatas': [], 'distances': [], 'similarities': [], 'ids': []}
+                for _ in query_texts
+            ]
+    
+    @staticmethod
+    def _rerank(
+        query_vec: np.ndarray,
+        cand_matrix: np.ndarray,
+        k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact cosine top-k over a candidate matrix
+        
+        Args:
+            query_vec: Query embedding, shape (dim,)
+            cand_matrix: Candidate embeddings, shape (n, dim)
+            k: Number of results to keep
+            
+        Returns:
+            Tuple of (candidate indices, cosine distances), best first
+        """
+        if simsimd is not None:
+            distances = np.asarray(
+                simsimd.cdist(query_vec[np.newaxis, :], cand_matrix, metric="cosine")
+            ).reshape(-1)
+        else:
+            norms = np.linalg.norm(cand_matrix, axis=1) * np.linalg.norm(query_vec)
+            distances = 1.0 - (cand_matrix @ query_vec) / np.maximum(norms, 1e-12)
+        
+        k = min(k, len(distances))
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        return top, distances[top]
+    
+    @staticmethod
+    def _filter_results(
+        results: Dict[str, Any],
+        q: int,
+        min_similarity: float,
+        space: str = "cosine"
+    ) -> Dict[str, Any]:
+        """
+        Filter one query's raw ChromaDB results by similarity threshold
+        
+        Args:
+            results: Raw collection.query() output
+            q: Index of the query within the batch
+            min_similarity: Minimum similarity threshold (0-1)
+            space: Distance space of the collection ('cosine', 'l2' or 'ip')
+            
+        Returns:
+            Filtered documents, metadata, distances, similarities and ids
+        """
+        # Filter by similarity threshold (ChromaDB returns distances, lower is better)
+        filtered_results = {
+            'documents': [],
+            'metadatas': [],
+            'distances': [],
+            'similarities': [],
+            'ids': []
+        }
+        
+        if results['documents'] and results['documents'][q]:
+            # Cosine/inner-product distance converts directly to similarity;
+            # squared L2 (collections created before cosine space) maps to
+            # 1 / (1 + d), the mapping those collections were filtered with
+            distances = np.asarray(results['distances'][q], dtype=np.float32)
+            if space == "l2":
+                similarities = 1.0 / (1.0 + distances)
+            else:
+                similarities = 1.0 - distances
+            idx = np.nonzero(similarities >= min_similarity)[0]
+            # Plain ints index Python lists faster than NumPy scalars
+            keep = idx.tolist()
+            
+            documents = results['documents'][q]
+            metadatas = results['metadatas'][q]
+            ids = results['ids'][q]
+            filtered_results['documents'] = [documents[i] for i in keep]
+            filtered_results['metadatas'] = [metadatas[i] for i in keep]
+            filtered_results['distances'] = distances[idx].tolist()
+            filtered_results['similarities'] = similarities[idx].tolist()
+            filtered_results['ids'] = [ids[i] for i in keep]
+        
+        return filtered_results
     
     def delete_collection(self, collection_name: str = "resumes") -> bool:
         """
@@ -159,7 +435,9 @@ class LocalVectorStore:
             Success status
         """
         try:
+            self._collections.pop(collection_name, None)
             self.client.delete_collection(name=collection_name)
+            self.data_version += 1
             print(f"✅ Deleted collection '{collection_name}'")
             return True
         except Exception as e:
@@ -201,17 +479,21 @@ class LocalVectorStore:
 # Singleton instance
 _vector_store_instance = None
 
-def get_vector_store(persist_directory: str = "./data/vector_db") -> LocalVectorStore:
+def get_vector_store(
+    persist_directory: str = "./data/vector_db",
+    embedding_model: Optional[str] = None
+) -> LocalVectorStore:
     """
     Get singleton instance of LocalVectorStore
     
     Args:
         persist_directory: Path to store vector database
+        embedding_model: SentenceTransformer model name (used on first creation)
         
     Returns:
         LocalVectorStore instance
     """
     global _vector_store_instance
     if _vector_store_instance is None:
-        _vector_store_instance = LocalVectorStore(persist_directory)
+        _vector_store_instance = LocalVectorStore(persist_directory, embedding_model)
     return _vector_store_instance
@@ -3,10 +3,16 @@ MCP Server for Resume Optimization Tools
 Implements Model Context Protocol (MCP) specification for tool discovery and execution.
 """
 from mcp.server.fastmcp import FastMCP
-from typing import Dict, List, Any, Optional
+from typing import Any
 import asyncio
+import atexit
+import bisect
+import concurrent.futures
+import multiprocessing
+import os
 import re
 import json
+from functools import lru_cache, partial
 from pathlib import Path
 import sys
 
@@ -19,35 +25,100 @@ from resume_optimizer.tools.mcp_tools import (
     ResumeParserTool
 )
 
+# Well-formed inline link: [text](target)
+_LINK_RE = re.compile(r'\[[^\]\n]*\]\([^)\n]*\)')
+# Start of a link target; any occurrence outside a well-formed link is malformed
+_LINK_TARGET_RE = re.compile(r'\]\(')
+# Header whose run of '#' is followed directly by text instead of a space
+_BAD_HEADER_RE = re.compile(r'^#+(?=[^# \r\n])', re.M)
+_NEWLINE_RE = re.compile(r'\n')
+
+
 # Placeholder for MarkdownValidatorTool (to be implemented)
 class MarkdownValidatorTool:
-    def validate_markdown(self, markdown_content: str) -> Dict:
+    def validate_markdown(self, markdown_content: str) -> dict:
         """Validate Markdown content"""
         # Basic validation - check for common issues
         errors = []
         warnings = []
         suggestions = []
         
-        lines = markdown_content.split('\n')
-        for i, line in enumerate(lines, 1):
-            # Check for broken links
-            if '[' in line and ']' in line and '(' in line and ')' in line:
-                if line.count('[') != line.count(']') or line.count('(') != line.count(')'):
-                    errors.append(f"Line {i}: Malformed link syntax")
-            
-            # Check for proper header formatting
-            if line.startswith('#'):
-                if not line.startswith('# ') and len(line) > 1:
-                    warnings.append(f"Line {i}: Header should have space after #")
+        # Offsets where each line starts, used to map match positions to line numbers
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(markdown_content))
+        
+        def line_of(pos: int) -> int:
+            return bisect.bisect_right(line_starts, pos)
+        
+        # Check for broken links
+        well_formed = {m.start() + m.group().index('](') for m in _LINK_RE.finditer(markdown_content)}
+        bad_link_lines = sorted({
+            line_of(m.start())
+            for m in _LINK_TARGET_RE.finditer(markdown_content)
+            if m.start() not in well_formed
+        })
+        errors.extend(f"Line {i}: Malformed link syntax" for i in bad_link_lines)
+        
+        # Check for proper header formatting
+        bad_header_lines = [line_of(m.start()) for m in _BAD_HEADER_RE.finditer(markdown_content)]
+        warnings.extend(f"Line {i}: Header should have space after #" for i in bad_header_lines)
         
         return {
             "is_valid": len(errors) == 0,
             "errors": errors,
             "warnings": warnings,
             "suggestions": suggestions,
-            "line_numbers": [i+1 for i in range(len(lines))]
+            "line_numbers": sorted(set(bad_link_lines).union(bad_header_lines))
         }
 
+# Shared tool instances; the tools keep no per-call state, so one instance
+# of each can serve concurrent requests.
+_ATS = ATSScoringTool()
+_KW = KeywordExtractorTool()
+_RP = ResumeParserTool()
+_MD = MarkdownValidatorTool()
+
+# CPU-bound scoring/extraction runs in worker processes so it is not serialized
+# by the GIL; file parsing and markdown checks stay on a thread pool. The
+# process pool is started on first use with the spawn method, since forking
+# this multithreaded server could deadlock on locks held at fork time.
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(thread_name_prefix="resume-tools")
+_CPU_POOL = None
+_CPU_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def _init_cpu_worker():
+    """Send worker output to stderr; stdout carries the JSON-RPC stream"""
+    sys.stdout = sys.stderr
+
+
+def _get_cpu_pool() -> concurrent.futures.Executor:
+    """Return the shared process pool, starting it on first use"""
+    global _CPU_POOL
+    if _CPU_POOL is None:
+        _CPU_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=_CPU_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_cpu_worker
+        )
+        atexit.register(_CPU_POOL.shutdown, cancel_futures=True)
+    return _CPU_POOL
+
+
+# Module-level entry points for the process pool: only the function name is
+# pickled per call, and each worker uses its own module-level tool instance
+def _calculate_ats_score(**kwargs):
+    return _ATS.calculate_score(**kwargs)
+
+
+def _extract_keywords(**kwargs):
+    return _KW.extract_keywords(**kwargs)
+
+
+async def _run_in_pool(pool: concurrent.futures.Executor, func, **kwargs):
+    """Run a blocking tool method on the given executor"""
+    return await asyncio.get_running_loop().run_in_executor(pool, partial(func, **kwargs))
+
 # Initialize MCP Server
 mcp = FastMCP("resume-optimizer-tools")
 
@@ -59,7 +130,7 @@ mcp = FastMCP("resume-optimizer-tools")
 async def calculate_ats_score(
     resume_text: str,
     job_description: str
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """
     Calculate ATS (Applicant Tracking System) compatibility score between resume and job description.
     
@@ -83,11 +154,10 @@ async def calculate_ats_score(
         - grade: Letter grade (A-F)
         - recommendations: List of improvement suggestions
     """
-    tool = ATSScoringTool()
-    
     try:
-        result = await asyncio.to_thread(
-            tool.calculate_score,
+        result = await _run_in_pool(
+            _get_cpu_pool(),
+            _calculate_ats_score,
             resume_text=resume_text,
             job_description=job_description
         )
@@ -115,7 +185,7 @@ async def calculate_ats_score(
 # TOOL 2: Keyword Extraction
 # ============================================
 @mcp.tool()
-async def extract_keywords(text: str) -> Dict[str, Any]:
+async def extract_keywords(text: str) -> dict[str, Any]:
     """
     Extract technical skills, soft skills, and action verbs from job description text.
     
@@ -136,11 +206,10 @@ async def extract_keywords(text: str) -> Dict[str, Any]:
         - keyword_density: Frequency analysis of top keywords
         - total_keywords: Total number of unique keywords extracted
     """
-    tool = KeywordExtractorTool()
-    
     try:
-        result = await asyncio.to_thread(
-            tool.extract_keywords,
+        result = await _run_in_pool(
+            _get_cpu_pool(),
+            _extract_keywords,
             text=text
         )
         
@@ -166,7 +235,7 @@ async def extract_keywords(text: str) -> Dict[str, Any]:
 # TOOL 3: Markdown Validation
 # ============================================
 @mcp.tool()
-async def validate_markdown(markdown_content: str) -> Dict[str, Any]:
+async def validate_markdown(markdown_content: str) -> dict[str, Any]:
     """
     Validate Markdown syntax and structure for resume formatting.
     
@@ -187,10 +256,11 @@ async def validate_markdown(markdown_content: str) -> Dict[str, Any]:
         - suggestions: Improvement recommendations
         - line_numbers: Error locations in source
     """
-    tool = MarkdownValidatorTool()
+    tool = _MD
     
     try:
-        result = await asyncio.to_thread(
+        result = await _run_in_pool(
+            _IO_POOL,
             tool.validate_markdown,
             markdown_content=markdown_content
         )
@@ -216,7 +286,7 @@ async def validate_markdown(markdown_content: str) -> Dict[str, Any]:
 # TOOL 4: Resume Parser
 # ============================================
 @mcp.tool()
-async def parse_resume(file_path: str) -> Dict[str, Any]:
+async def parse_resume(file_path: str) -> dict[str, Any]:
     """
     Parse resume file (PDF/DOCX) and extract structured content.
     
@@ -237,10 +307,11 @@ async def parse_resume(file_path: str) -> Dict[str, Any]:
         - contact_info: Extracted contact details
         - format: File format (pdf/docx)
     """
-    tool = ResumeParserTool()
+    tool = _RP
     
     try:
-        result = await asyncio.to_thread(
+        result = await _run_in_pool(
+            _IO_POOL,
             tool.parse_resume,
             file_path=file_path
         )
@@ -265,26 +336,8 @@ async def parse_resume(file_path: str) -> Dict[str, Any]:
 # ============================================
 # RESOURCE: Resume Templates
 # ============================================
-@mcp.resource("template://resume/{template_name}")
-async def get_resume_template(template_name: str) -> str:
-    """
-    Provide Markdown resume templates for different styles.
-    
-    Available templates:
-    - template://resume/professional - Standard professional format
-    - template://resume/academic - Academic/research-focused format
-    - template://resume/technical - Technical/engineering format
-    - template://resume/creative - Creative industry format
-    
-    Args:
-        template_name: Template type (professional, academic, technical, creative)
-        
-    Returns:
-        Markdown template content as string
-    """
-    
-    templates = {
-        "professional": """# [YOUR NAME]
+_RESUME_TEMPLATES: dict[str, str] = {
+    "professional": """# [YOUR NAME]
 
 **[Professional Title]**
 
@@ -340,8 +393,8 @@ async def get_resume_template(template_name: str) -> str:
 - [Certification Name] | [Issuing Organization] | [Year]
 - [Certification Name] | [Issuing Organization] | [Year]
 """,
-        
-        "academic": """# [YOUR NAME]
+    
+    "academic": """# [YOUR NAME]
 
 *Curriculum Vitae*
 
@@ -417,8 +470,8 @@ async def get_resume_template(template_name: str) -> str:
 - Reviewer: [Journal Names]
 - Committee Member: [Committee/Conference Names]
 """,
-        
-        "technical": """# [YOUR NAME]
+    
+    "technical": """# [YOUR NAME]
 
 ## Software Engineer
 
@@ -479,71 +532,73 @@ async def get_resume_template(template_name: str) -> str:
 - Relevant Coursework: Data Structures, Algorithms, Database Systems
 - GPA: X.XX/4.0
 """,
-        
-        "creative": """\\documentclass[11pt,a4paper]{article}
-\\usepackage[margin=0.75in]{geometry}
-\\usepackage{graphicx}
-\\usepackage{xcolor}
-\\usepackage{tikz}
+    
+    "creative": r"""\documentclass[11pt,a4paper]{article}
+\usepackage[margin=0.75in]{geometry}
+\usepackage{graphicx}
+\usepackage{xcolor}
+\usepackage{tikz}
 
-\\definecolor{accent}{RGB}{0,102,204}
+\definecolor{accent}{RGB}{0,102,204}
 
-\\begin{document}
+\begin{document}
 
 % Creative header with accent color
-\\begin{center}
-{\\Huge \\color{accent}\\textbf{[YOUR NAME]}}\\\\[5pt]
-{\\large Creative Professional}\\\\[8pt]
+\begin{center}
+{\Huge \color{accent}\textbf{[YOUR NAME]}}\\[5pt]
+{\large Creative Professional}\\[8pt]
 [Portfolio URL] | [Email] | [Social Media]
-\\end{center}
+\end{center}
 
-\\section*{ABOUT ME}
+\section*{ABOUT ME}
 [Creative profile]
 
-\\section*{PORTFOLIO HIGHLIGHTS}
+\section*{PORTFOLIO HIGHLIGHTS}
 [Project showcases]
 
-\\section*{EXPERIENCE}
+\section*{EXPERIENCE}
 [Work history with creative focus]
 
-\\section*{SKILLS \\& TOOLS}
+\section*{SKILLS \& TOOLS}
 [Creative skills and software]
 
-\\end{document}"""
-    }
-    
-    return templates.get(template_name, templates["professional"])
+\end{document}"""
+}
+_DEFAULT_RESUME_TEMPLATE = _RESUME_TEMPLATES["professional"]
 
 
-# ============================================
-# PROMPT: Resume Optimization Workflow
-# ============================================
-@mcp.prompt()
-async def optimize_resume_prompt(
-    job_title: str,
-    company: str,
-    experience_level: str = "mid"
-) -> List[Dict[str, str]]:
+@mcp.resource("template://resume/{template_name}")
+def get_resume_template(template_name: str) -> str:
     """
-    Generate a comprehensive prompt for resume optimization workflow.
+    Provide Markdown resume templates for different styles.
+    
+    Available templates:
+    - template://resume/professional - Standard professional format
+    - template://resume/academic - Academic/research-focused format
+    - template://resume/technical - Technical/engineering format
+    - template://resume/creative - Creative industry format
     
     Args:
-        job_title: Target job position title
-        company: Target company name
-        experience_level: Career level - 'entry', 'mid', 'senior', 'lead'
+        template_name: Template type (professional, academic, technical, creative)
         
     Returns:
-        List of message dictionaries for LLM consumption
+        Markdown template content as string
     """
-    
-    experience_guidance = {
-        "entry": "Focus on education, projects, internships, and transferable skills.",
-        "mid": "Emphasize 3-7 years of experience with quantified achievements and technical depth.",
-        "senior": "Highlight 7+ years, leadership, strategic impact, and mentorship.",
-        "lead": "Showcase technical leadership, architecture decisions, and team/org-level impact."
-    }
-    
-    prompt_text = f"""You are an expert resume optimization specialist with deep knowledge of ATS systems and recruiting best practices.
+    return _RESUME_TEMPLATES.get(template_name, _DEFAULT_RESUME_TEMPLATE)
+
+
+# ============================================
+# PROMPT: Resume Optimization Workflow
+# ============================================
+_EXPERIENCE_GUIDANCE = {
+    "entry": "Focus on education, projects, internships, and transferable skills.",
+    "mid": "Emphasize 3-7 years of experience with quantified achievements and technical depth.",
+    "senior": "Highlight 7+ years, leadership, strategic impact, and mentorship.",
+    "lead": "Showcase technical leadership, architecture decisions, and team/org-level impact."
+}
+_DEFAULT_EXPERIENCE_GUIDANCE = _EXPERIENCE_GUIDANCE["mid"]
+
+_OPTIMIZE_PROMPT_FMT = """You are an expert resume optimization specialist with deep knowledge of ATS systems and recruiting best practices.
 
 **TARGET POSITION**
 - Job Title: {job_title}
@@ -552,7 +607,7 @@ async def optimize_resume_prompt(
 
 **YOUR OPTIMIZATION MISSION**
 
-{experience_guidance.get(experience_level, experience_guidance["mid"])}
+{guidance}
 
 **STEP-BY-STEP OPTIMIZATION PROCESS**
 
@@ -600,34 +655,46 @@ Provide:
 
 Begin optimization now."""
 
-    return [
-        {
-            "role": "user",
-            "content": prompt_text
-        }
-    ]
+
+@lru_cache(maxsize=256)
+def _build_optimize_prompt(job_title: str, company: str, experience_level: str) -> str:
+    """Render the optimization prompt; repeat requests for the same role reuse the text"""
+    return _OPTIMIZE_PROMPT_FMT.format_map({
+        "job_title": job_title,
+        "company": company,
+        "experience_level": experience_level,
+        "guidance": _EXPERIENCE_GUIDANCE.get(experience_level, _DEFAULT_EXPERIENCE_GUIDANCE)
+    })
 
 
-# ============================================
-# PROMPT: ATS Keyword Matching Strategy
-# ============================================
 @mcp.prompt()
-async def ats_keyword_strategy(
-    job_description: str,
-    current_score: int = 0
-) -> List[Dict[str, str]]:
+def optimize_resume_prompt(
+    job_title: str,
+    company: str,
+    experience_level: str = "mid"
+) -> list[dict[str, str]]:
     """
-    Generate strategic guidance for improving ATS keyword matching.
+    Generate a comprehensive prompt for resume optimization workflow.
     
     Args:
-        job_description: The full job posting text
-        current_score: Current ATS score (0-100)
+        job_title: Target job position title
+        company: Target company name
+        experience_level: Career level - 'entry', 'mid', 'senior', 'lead'
         
     Returns:
-        List of message dictionaries with keyword strategy
+        List of message dictionaries for LLM consumption
     """
     
-    prompt_text = f"""You are an ATS optimization expert specializing in keyword strategy.
+    return [{
+        "role": "user",
+        "content": _build_optimize_prompt(job_title, company, experience_level)
+    }]
+
+
+# ============================================
+# PROMPT: ATS Keyword Matching Strategy
+# ============================================
+_ATS_PROMPT_FMT = """You are an ATS optimization expert specializing in keyword strategy.
 
 **CURRENT ATS SCORE**: {current_score}%
 **TARGET SCORE**: 90%+
@@ -664,17 +731,48 @@ async def ats_keyword_strategy(
 **ACTION PLAN**
 Generate a prioritized list of keywords to add, with specific placement recommendations for maximum ATS impact while maintaining readability."""
 
-    return [
-        {
-            "role": "user",
-            "content": prompt_text
-        }
-    ]
+
+@lru_cache(maxsize=64)
+def _build_ats_prompt(job_description: str, current_score: int) -> str:
+    """Render the ATS keyword prompt; kept small since job descriptions are long keys"""
+    return _ATS_PROMPT_FMT.format_map({
+        "job_description": job_description,
+        "current_score": current_score
+    })
+
+
+@mcp.prompt()
+def ats_keyword_strategy(
+    job_description: str,
+    current_score: int = 0
+) -> list[dict[str, str]]:
+    """
+    Generate strategic guidance for improving ATS keyword matching.
+    
+    Args:
+        job_description: The full job posting text
+        current_score: Current ATS score (0-100)
+        
+    Returns:
+        List of message dictionaries with keyword strategy
+    """
+    
+    return [{
+        "role": "user",
+        "content": _build_ats_prompt(job_description, current_score)
+    }]
 
 
 # ============================================
 # Run MCP Server
 # ============================================
 if __name__ == "__main__":
+    # Use the libuv-based event loop when available (not supported on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run with STDIO transport for local agent communication
     mcp.run(transport="stdio")
@@ -3,14 +3,20 @@ Monitoring and Logging Module for Resume Optimizer
 
 Provides callback-based logging and monitoring for the multi-agent workflow.
 """
-from .callback_logger import (
-    WorkflowCallbackLogger,
-    get_callback_logger,
-    callback_logger
-)
+import importlib
 
-__all__ = [
-    'WorkflowCallbackLogger',
-    'get_callback_logger',
-    'callback_logger'
-]
+# Mirrors callback_logger.__all__; listed here so the lazy loader below knows
+# which names to resolve without importing the submodule.
+__all__ = ('WorkflowCallbackLogger', 'get_callback_logger', 'callback_logger')
+
+
+def __getattr__(name):
+    """Import the callback logger module on first access to one of its exports"""
+    if name in __all__:
+        module = importlib.import_module('.callback_logger', __name__)
+        # Bind every export at once: importing the submodule sets the package
+        # attribute 'callback_logger' to the module, which must be replaced by
+        # the logger instance of the same name.
+        globals().update((export, getattr(module, export)) for export in module.__all__)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,12 @@ Implements Google ADK callback patterns for comprehensive agent tracking
 """
 import logging
 import json
+import queue
+import threading
 import time
 import uuid
+import weakref
+from collections import defaultdict
 from datetime import datetime
 from typing import Optional, Dict, Any
 from pathlib import Path
@@ -15,6 +19,13 @@ from google.adk.tools import ToolContext
 from google.adk.models import LlmRequest, LlmResponse
 from google.genai import types
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['WorkflowCallbackLogger', 'get_callback_logger', 'callback_logger']
+
 
 # Configure logging
 LOG_DIR = Path("./logs")
@@ -35,6 +46,42 @@ callback_logger = logging.getLogger("ResumeOptimizer.Callbacks")
 callback_logger.setLevel(logging.DEBUG)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _preview(obj: Any, limit: int) -> str:
+    """Return the first `limit` characters of an object's text form, skipping str() for strings"""
+    if isinstance(obj, str):
+        return obj[:limit]
+    return str(obj)[:limit]
+
+
+# Queue marker telling the writer thread to flush, close the file and exit
+_STOP = object()
+
+
+def _stop_writer(q: queue.SimpleQueue, writer: threading.Thread):
+    """Tell a writer thread to drain and close its file, then wait for it"""
+    q.put(_STOP)
+    if writer is not threading.current_thread():
+        writer.join()
+
+
+class _LazyJSON:
+    """Defers JSON encoding of log message arguments until a handler formats them"""
+    __slots__ = ('obj',)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return json.dumps(self.obj)
+
+
 class WorkflowCallbackLogger:
     """
     Comprehensive callback handler for the Resume Optimization workflow.
@@ -48,25 +95,53 @@ class WorkflowCallbackLogger:
     - Error tracking
     """
     
-    def __init__(self, log_file: str = "workflow_execution.jsonl"):
+    __slots__ = (
+        "log_file", "execution_id", "start_time", "_stage_start", "_stage_duration",
+        "agent_call_counts", "tool_call_counts", "llm_call_counts", "state_changes",
+        "flush_every_n", "human_readable", "sync", "_fh", "_queue", "_closed", "_writer",
+        "_finalizer", "__weakref__"
+    )
+    
+    def __init__(
+        self,
+        log_file: str = "workflow_execution.jsonl",
+        flush_every_n: int = 32,
+        human_readable: bool = False,
+        sync: bool = False,
+        append: bool = False
+    ):
         """
         Initialize the callback logger.
         
         Args:
             log_file: Path to JSONL log file for structured logs
+            flush_every_n: Flush the JSONL file after at most this many written events
+            human_readable: Also emit per-event messages to the standard logger;
+                the JSONL file is always written
+            sync: Block each callback until its event is flushed to disk. Otherwise
+                events are batched and flushed when an agent completes or every
+                flush_every_n events, so a crash can lose the unflushed tail.
+            append: Keep existing events in the log file instead of truncating it
         """
         self.log_file = LOG_DIR / log_file
         self.execution_id = None
         self.start_time = None
-        self.stage_timings = {}
-        self.agent_call_counts = {}
-        self.tool_call_counts = {}
-        self.llm_call_counts = {}
+        self._stage_start = {}
+        self._stage_duration = defaultdict(float)
+        self.agent_call_counts = defaultdict(int)
+        self.tool_call_counts = defaultdict(int)
+        self.llm_call_counts = defaultdict(int)
         self.state_changes = []
+        self.flush_every_n = max(1, flush_every_n)
+        self.human_readable = human_readable
+        self.sync = sync
         
-        # Initialize log file
-        with open(self.log_file, 'w') as f:
-            f.write("")  # Clear file
+        # Truncate once unless appending, then keep the file open in append
+        # mode: other loggers on the same file interleave their lines instead
+        # of overwriting them. A background thread owns the handle from here on
+        if not append:
+            open(self.log_file, 'wb').close()
+        self._start_writer()
         
         callback_logger.info(f"WorkflowCallbackLogger initialized. Logging to {self.log_file}")
     
@@ -78,20 +153,108 @@ class WorkflowCallbackLogger:
             event_type: Type of event (e.g., "agent_start", "tool_call")
             details: Additional event details
         """
-        timestamp = datetime.now().isoformat()
-        log_entry = {
-            "timestamp": timestamp,
-            "execution_id": self.execution_id,
-            "event_type": event_type,
-            "details": details or {}
-        }
-        
-        # Write to JSONL file
-        with open(self.log_file, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # Hand off to the writer thread (restarted if closed by a previous run);
+        # it builds the JSON line, including the ISO "timestamp" derived from ts_ns
+        if self._closed:
+            self._start_writer()
+        self._queue.put((time.time_ns(), self.execution_id, event_type, details or {}))
+        if self.sync:
+            self.flush()
         
         # Also log to standard logger
-        callback_logger.info(f"[{event_type}] {json.dumps(details, indent=None)}")
+        if self.human_readable:
+            callback_logger.info("[%s] %s", event_type, _LazyJSON(details))
+    
+    def _start_writer(self):
+        """Open the JSONL file for appending and start the thread that drains queued events into it"""
+        self._fh = open(self.log_file, 'ab', buffering=65536)
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._drain,
+            args=(self._queue, self._fh, self.flush_every_n),
+            name="callback-log-writer",
+            daemon=True
+        )
+        self._writer.start()
+        # Stops the writer on close(), when the logger is garbage collected, or at
+        # interpreter exit, whichever comes first; it holds no reference to self
+        self._finalizer = weakref.finalize(self, _stop_writer, self._queue, self._writer)
+    
+    @staticmethod
+    def _drain(q: queue.SimpleQueue, fh, flush_every_n: int):
+        """Writer thread: serialize queued events in batches with one writelines per batch"""
+        unflushed = 0
+        # execution_id is constant for a run, so its JSON form is encoded once per change
+        last_execution_id = object()
+        execution_id_json = b'null'
+        while True:
+            item = q.get()
+            lines = []
+            waiters = []
+            stop = False
+            # An agent's events are flushed together once it completes
+            agent_completed = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    ts_ns, execution_id, event_type, details = item
+                    if event_type == "agent_complete":
+                        agent_completed = True
+                    if execution_id is not last_execution_id:
+                        last_execution_id = execution_id
+                        execution_id_json = _dumps(execution_id)
+                    timestamp = datetime.fromtimestamp(ts_ns // 1_000_000_000).replace(
+                        microsecond=ts_ns // 1000 % 1_000_000
+                    ).isoformat()
+                    try:
+                        lines.append(
+                            b'{"timestamp":"%s","ts_ns":%d,"execution_id":%s,"event_type":%s,"details":%s}\n'
+                            % (timestamp.encode('ascii'), ts_ns, execution_id_json,
+                               _dumps(event_type), _dumps(details))
+                        )
+                    except (TypeError, ValueError) as e:
+                        callback_logger.error("Dropping unserializable log event: %s", e)
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            
+            fh.writelines(lines)
+            unflushed += len(lines)
+            if stop or waiters or agent_completed or unflushed >= flush_every_n:
+                fh.flush()
+                unflushed = 0
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                fh.close()
+                return
+    
+    def flush(self):
+        """Block until every event logged so far has been written through to the JSONL file"""
+        if self._closed or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+    
+    def close(self):
+        """Drain pending events and close the JSONL file; safe to call more than once"""
+        if self._closed:
+            return
+        self._closed = True
+        self._finalizer()
+    
+    def __enter__(self) -> "WorkflowCallbackLogger":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     # ==================== AGENT LIFECYCLE CALLBACKS ====================
     
@@ -121,11 +284,11 @@ class WorkflowCallbackLogger:
         # Initialize execution tracking on first agent call
         if self.execution_id is None:
             self.execution_id = str(uuid.uuid4())
-            self.start_time = time.time()
-            callback_logger.info(f"🚀 Starting new workflow execution: {self.execution_id}")
+            self.start_time = time.perf_counter()
+            callback_logger.info("🚀 Starting new workflow execution: %s", self.execution_id)
         
         # Track agent call
-        self.agent_call_counts[agent_name] = self.agent_call_counts.get(agent_name, 0) + 1
+        self.agent_call_counts[agent_name] += 1
         
         # Log agent start
         self._log_event("agent_start", {
@@ -135,14 +298,14 @@ class WorkflowCallbackLogger:
             "session_state_keys": list(callback_context.state.keys()) if hasattr(callback_context, 'state') else []
         })
         
-        callback_logger.info(
-            f"📥 [Invocation: {invocation_id}] Agent '{agent_name}' starting "
-            f"(call #{self.agent_call_counts[agent_name]})"
-        )
+        if self.human_readable:
+            callback_logger.info(
+                "📥 [Invocation: %s] Agent '%s' starting (call #%d)",
+                invocation_id, agent_name, self.agent_call_counts[agent_name]
+            )
         
         # Record stage start time
-        if agent_name not in self.stage_timings:
-            self.stage_timings[agent_name] = {"start": time.time()}
+        self._stage_start[agent_name] = time.perf_counter()
         
         return None  # Allow agent to proceed
     
@@ -172,10 +335,11 @@ class WorkflowCallbackLogger:
         agent_name = callback_context.agent_name
         invocation_id = callback_context.invocation_id
         
-        # Calculate execution time
-        if agent_name in self.stage_timings and "start" in self.stage_timings[agent_name]:
-            execution_time = time.time() - self.stage_timings[agent_name]["start"]
-            self.stage_timings[agent_name]["duration"] = execution_time
+        # Calculate execution time of this invocation; stage totals accumulate
+        started = self._stage_start.pop(agent_name, None)
+        if started is not None:
+            execution_time = time.perf_counter() - started
+            self._stage_duration[agent_name] += execution_time
         else:
             execution_time = 0
         
@@ -194,10 +358,11 @@ class WorkflowCallbackLogger:
             "session_state_keys": list(callback_context.state.keys()) if hasattr(callback_context, 'state') else []
         })
         
-        callback_logger.info(
-            f"✅ [Invocation: {invocation_id}] Agent '{agent_name}' completed "
-            f"in {execution_time:.2f}s"
-        )
+        if self.human_readable:
+            callback_logger.info(
+                "✅ [Invocation: %s] Agent '%s' completed in %.2fs",
+                invocation_id, agent_name, execution_time
+            )
         
         return None  # Use original result
     
@@ -230,20 +395,26 @@ class WorkflowCallbackLogger:
         invocation_id = callback_context.invocation_id
         
         # Track LLM calls
-        self.llm_call_counts[agent_name] = self.llm_call_counts.get(agent_name, 0) + 1
+        self.llm_call_counts[agent_name] += 1
         
         # Extract prompt info
-        prompt_length = 0
+        contents = llm_request.contents or ()
+        prompt_length = sum(
+            len(getattr(part, 'text', None) or "")
+            for content in contents
+            for part in (getattr(content, 'parts', None) or ())
+        )
+        
+        # Walk backwards so only the most recent user text part is inspected
         last_user_message = ""
-        if llm_request.contents:
-            for content in llm_request.contents:
-                if hasattr(content, 'parts'):
-                    for part in content.parts:
-                        if hasattr(part, 'text'):
-                            text = part.text or ""
-                            prompt_length += len(text)
-                            if content.role == 'user':
-                                last_user_message = text[:100]  # First 100 chars
+        for content in reversed(contents):
+            if content.role != 'user':
+                continue
+            texts = [part for part in (getattr(content, 'parts', None) or ()) if hasattr(part, 'text')]
+            if texts:
+                last_user_message = (texts[-1].text or "")[:100]  # First 100 chars
+                break
+        config = getattr(llm_request, 'config', None)
         
         # Log LLM call
         self._log_event("llm_call", {
@@ -253,13 +424,14 @@ class WorkflowCallbackLogger:
             "model": llm_request.model if hasattr(llm_request, 'model') else "unknown",
             "prompt_length_chars": prompt_length,
             "last_user_message_preview": last_user_message,
-            "system_instruction_present": bool(llm_request.config.system_instruction) if hasattr(llm_request, 'config') and llm_request.config else False
+            "system_instruction_present": bool(config and config.system_instruction)
         })
         
-        callback_logger.debug(
-            f"🤖 [Invocation: {invocation_id}] LLM call #{self.llm_call_counts[agent_name]} "
-            f"for agent '{agent_name}' - Prompt: {prompt_length} chars"
-        )
+        if self.human_readable:
+            callback_logger.debug(
+                "🤖 [Invocation: %s] LLM call #%d for agent '%s' - Prompt: %d chars",
+                invocation_id, self.llm_call_counts[agent_name], agent_name, prompt_length
+            )
         
         return None  # Allow LLM call to proceed
     
@@ -318,15 +490,16 @@ class WorkflowCallbackLogger:
             "error_message": llm_response.error_message if has_error else None
         })
         
-        callback_logger.debug(
-            f"💬 [Invocation: {invocation_id}] LLM response for '{agent_name}' - "
-            f"{response_length} chars, tool_call={has_tool_call}"
-        )
+        if self.human_readable:
+            callback_logger.debug(
+                "💬 [Invocation: %s] LLM response for '%s' - %d chars, tool_call=%s",
+                invocation_id, agent_name, response_length, has_tool_call
+            )
         
         if has_error:
             callback_logger.error(
-                f"❌ [Invocation: {invocation_id}] LLM error for '{agent_name}': "
-                f"{llm_response.error_message}"
+                "❌ [Invocation: %s] LLM error for '%s': %s",
+                invocation_id, agent_name, llm_response.error_message
             )
         
         return None  # Use original response
@@ -359,12 +532,12 @@ class WorkflowCallbackLogger:
         tool_name = getattr(tool_context, 'tool_name', 'unknown_tool')
         
         # Track tool calls
-        self.tool_call_counts[tool_name] = self.tool_call_counts.get(tool_name, 0) + 1
+        self.tool_call_counts[tool_name] += 1
         
         # Get tool arguments (sanitize sensitive data)
         tool_args = {}
         if hasattr(tool_context, 'arguments'):
-            tool_args = {k: str(v)[:100] for k, v in (tool_context.arguments or {}).items()}
+            tool_args = {k: _preview(v, 100) for k, v in (tool_context.arguments or {}).items()}
         
         # Log tool call
         self._log_event("tool_call", {
@@ -375,10 +548,11 @@ class WorkflowCallbackLogger:
             "arguments": tool_args
         })
         
-        callback_logger.info(
-            f"🔧 [Invocation: {invocation_id}] Tool call #{self.tool_call_counts[tool_name]} "
-            f"- '{tool_name}' by agent '{agent_name}'"
-        )
+        if self.human_readable:
+            callback_logger.info(
+                "🔧 [Invocation: %s] Tool call #%d - '%s' by agent '%s'",
+                invocation_id, self.tool_call_counts[tool_name], tool_name, agent_name
+            )
         
         return None  # Allow tool execution
     
@@ -410,8 +584,14 @@ class WorkflowCallbackLogger:
         tool_name = getattr(tool_context, 'tool_name', 'unknown_tool')
         
         # Extract result info
-        result_preview = str(tool_result)[:200] if tool_result else "None"
-        result_size = len(str(tool_result)) if tool_result else 0
+        # Render the result once; both the preview and the size derive from it
+        if tool_result:
+            result_text = tool_result if isinstance(tool_result, str) else str(tool_result)
+            result_preview = result_text[:200]
+            result_size = len(result_text)
+        else:
+            result_preview = "None"
+            result_size = 0
         
         # Check for errors in result
         is_error = isinstance(tool_result, dict) and "error" in tool_result
@@ -428,13 +608,13 @@ class WorkflowCallbackLogger:
         
         if is_error:
             callback_logger.warning(
-                f"⚠️ [Invocation: {invocation_id}] Tool '{tool_name}' returned error: "
-                f"{tool_result.get('error', 'Unknown error')}"
+                "⚠️ [Invocation: %s] Tool '%s' returned error: %s",
+                invocation_id, tool_name, tool_result.get('error', 'Unknown error')
             )
-        else:
+        elif self.human_readable:
             callback_logger.info(
-                f"✓ [Invocation: {invocation_id}] Tool '{tool_name}' completed - "
-                f"{result_size} chars"
+                "✓ [Invocation: %s] Tool '%s' completed - %d chars",
+                invocation_id, tool_name, result_size
             )
         
         return None  # Use original result
@@ -448,7 +628,7 @@ class WorkflowCallbackLogger:
         Returns:
             Dict with execution metrics and summary
         """
-        total_time = time.time() - self.start_time if self.start_time else 0
+        total_time = time.perf_counter() - self.start_time if self.start_time else 0
         
         summary = {
             "execution_id": self.execution_id,
@@ -457,40 +637,43 @@ class WorkflowCallbackLogger:
             "total_agent_invocations": sum(self.agent_call_counts.values()),
             "total_llm_calls": sum(self.llm_call_counts.values()),
             "total_tool_calls": sum(self.tool_call_counts.values()),
-            "agent_breakdown": self.agent_call_counts,
-            "llm_call_breakdown": self.llm_call_counts,
-            "tool_call_breakdown": self.tool_call_counts,
-            "stage_timings": {
-                agent: timing.get("duration", 0) 
-                for agent, timing in self.stage_timings.items()
-            }
+            "agent_breakdown": dict(self.agent_call_counts),
+            "llm_call_breakdown": dict(self.llm_call_counts),
+            "tool_call_breakdown": dict(self.tool_call_counts),
+            "stage_timings": dict(self._stage_duration)
         }
         
         # Log final summary
         self._log_event("execution_summary", summary)
-        
-        callback_logger.info("=" * 80)
-        callback_logger.info(f"📊 WORKFLOW EXECUTION SUMMARY")
-        callback_logger.info(f"   Execution ID: {self.execution_id}")
-        callback_logger.info(f"   Total Time: {total_time:.2f}s")
-        callback_logger.info(f"   Agents Called: {len(self.agent_call_counts)}")
-        callback_logger.info(f"   LLM Calls: {sum(self.llm_call_counts.values())}")
-        callback_logger.info(f"   Tool Calls: {sum(self.tool_call_counts.values())}")
-        callback_logger.info("=" * 80)
+        self.flush()
+        
+        if callback_logger.isEnabledFor(logging.INFO):
+            callback_logger.info("=" * 80)
+            callback_logger.info("📊 WORKFLOW EXECUTION SUMMARY")
+            callback_logger.info("   Execution ID: %s", self.execution_id)
+            callback_logger.info("   Total Time: %.2fs", total_time)
+            callback_logger.info("   Agents Called: %d", summary["total_agents_called"])
+            callback_logger.info("   LLM Calls: %d", summary["total_llm_calls"])
+            callback_logger.info("   Tool Calls: %d", summary["total_tool_calls"])
+            callback_logger.info("=" * 80)
         
         return summary
 
 
 # ==================== HELPER FUNCTIONS ====================
 
-def get_callback_logger(log_file: str = "workflow_execution.jsonl") -> WorkflowCallbackLogger:
+def get_callback_logger(
+    log_file: str = "workflow_execution.jsonl",
+    human_readable: bool = False
+) -> WorkflowCallbackLogger:
     """
     Factory function to create a callback logger instance.
     
     Args:
         log_file: Name of log file
+        human_readable: Also emit per-event messages to the standard logger
         
     Returns:
         Configured WorkflowCallbackLogger instance
     """
-    return WorkflowCallbackLogger(log_file=log_file)
+    return WorkflowCallbackLogger(log_file=log_file, human_readable=human_readable)
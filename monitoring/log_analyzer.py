@@ -3,11 +3,48 @@ Log Analysis Utility for Resume Optimizer
 
 Analyzes JSONL logs to provide insights and metrics.
 """
+import io
 import json
+import mmap
 from pathlib import Path
 from typing import List, Dict, Any
 from collections import defaultdict
-import statistics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson parses the raw bytes directly; stdlib json also accepts UTF-8 bytes
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _counter(key: str):
+    """Build an event handler that increments one per-agent counter"""
+    def handler(stats: Dict[str, Any], details: Dict[str, Any]):
+        stats[key] += 1
+    return handler
+
+
+def _record_completion(stats: Dict[str, Any], details: Dict[str, Any]):
+    """Fold an agent_complete duration into running count/sum/min/max"""
+    exec_time = details.get('execution_time_seconds', 0)
+    if stats['execution_count']:
+        stats['max_execution_time'] = max(stats['max_execution_time'], exec_time)
+        stats['min_execution_time'] = min(stats['min_execution_time'], exec_time)
+    else:
+        stats['max_execution_time'] = stats['min_execution_time'] = exec_time
+    stats['execution_count'] += 1
+    stats['total_execution_time'] += exec_time
+
+
+# Per-event-type statistics updates, dispatched by event_type
+_EVENT_HANDLERS = {
+    'agent_start': _counter('calls'),
+    'agent_complete': _record_completion,
+    'llm_call': _counter('llm_calls'),
+    'tool_call': _counter('tool_calls'),
+}
 
 
 class LogAnalyzer:
@@ -15,89 +52,132 @@ class LogAnalyzer:
     
     def __init__(self, log_file: Path):
         self.log_file = log_file
-        self.events = []
-        self._load_logs()
+        self.event_count = 0
+        self._events = None
+        self._stats = None
+        if not self.log_file.exists():
+            print(f"Log file not found: {self.log_file}")
+    
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """All parsed events, loaded from the file on first access"""
+        if self._events is None:
+            self._load_logs()
+        return self._events
     
     def _load_logs(self):
         """Load events from JSONL file"""
+        self._events = list(self._iter_log_file())
+    
+    def _iter_log_file(self):
+        """Yield parsed events from the JSONL file, skipping blank and malformed lines"""
         if not self.log_file.exists():
-            print(f"Log file not found: {self.log_file}")
             return
         
-        with open(self.log_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        self.events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        with open(self.log_file, 'rb') as f:
+            if not f.seek(0, 2):
+                return  # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Scan for newlines in the mapped file and hand raw byte slices to the parser
+                find = mm.find
+                pos = 0
+                end = len(mm)
+                while pos < end:
+                    nl = find(b'\n', pos)
+                    if nl < 0:
+                        nl = end
+                    line = mm[pos:nl]
+                    pos = nl + 1
+                    if line.strip():
+                        try:
+                            yield _loads(line)
+                        except ValueError:
+                            continue
     
     def get_execution_timeline(self) -> List[Dict[str, Any]]:
         """Get chronological timeline of events"""
-        return sorted(self.events, key=lambda x: x['timestamp'])
+        # The callback logger appends events from a single writer in the order
+        # they were logged, so file order already is chronological order
+        return list(self.events)
     
     def get_agent_statistics(self) -> Dict[str, Any]:
         """Get statistics per agent"""
+        return self.stream_statistics()
+    
+    def stream_statistics(self) -> Dict[str, Any]:
+        """
+        Compute per-agent statistics in a single pass.
+        
+        Reads straight from the log file unless events are already loaded, so
+        the full event list is never materialized just for statistics. The
+        result is computed once and reused.
+        """
+        if self._stats is not None:
+            return self._stats
+        
         agent_stats = defaultdict(lambda: {
             'calls': 0,
-            'execution_times': [],
+            'execution_count': 0,
+            'total_execution_time': 0.0,
             'llm_calls': 0,
             'tool_calls': 0
         })
         
-        for event in self.events:
+        handlers = _EVENT_HANDLERS
+        event_count = 0
+        source = self._events if self._events is not None else self._iter_log_file()
+        for event in source:
+            event_count += 1
             details = event.get('details', {})
             agent_name = details.get('agent_name')
             
             if not agent_name:
                 continue
             
-            if event['event_type'] == 'agent_start':
-                agent_stats[agent_name]['calls'] += 1
-            elif event['event_type'] == 'agent_complete':
-                exec_time = details.get('execution_time_seconds', 0)
-                agent_stats[agent_name]['execution_times'].append(exec_time)
-            elif event['event_type'] == 'llm_call':
-                agent_stats[agent_name]['llm_calls'] += 1
-            elif event['event_type'] == 'tool_call':
-                agent_stats[agent_name]['tool_calls'] += 1
+            handler = handlers.get(event['event_type'])
+            if handler is not None:
+                handler(agent_stats[agent_name], details)
         
         # Calculate averages
-        for agent_name, stats in agent_stats.items():
-            times = stats['execution_times']
-            if times:
-                stats['avg_execution_time'] = statistics.mean(times)
-                stats['max_execution_time'] = max(times)
-                stats['min_execution_time'] = min(times)
+        for stats in agent_stats.values():
+            if stats['execution_count']:
+                stats['avg_execution_time'] = stats['total_execution_time'] / stats['execution_count']
         
-        return dict(agent_stats)
+        self.event_count = event_count
+        self._stats = dict(agent_stats)
+        return self._stats
     
     def get_summary_report(self) -> str:
         """Generate a human-readable summary report"""
         stats = self.get_agent_statistics()
+        heavy = "=" * 80
+        light = "-" * 80
         
-        report = []
-        report.append("=" * 80)
-        report.append("WORKFLOW EXECUTION ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append(f"\nTotal Events Logged: {len(self.events)}")
-        report.append(f"Total Agents: {len(stats)}")
-        report.append("\n" + "-" * 80)
-        report.append("AGENT STATISTICS")
-        report.append("-" * 80)
+        buf = io.StringIO()
+        w = buf.write
+        w(
+            f"{heavy}\nWORKFLOW EXECUTION ANALYSIS REPORT\n{heavy}\n"
+            f"\nTotal Events Logged: {self.event_count}\n"
+            f"Total Agents: {len(stats)}\n"
+            f"\n{light}\nAGENT STATISTICS\n{light}\n"
+        )
         
         for agent_name, agent_stats in sorted(stats.items()):
-            report.append(f"\n{agent_name}:")
-            report.append(f"  Calls: {agent_stats['calls']}")
-            report.append(f"  LLM Calls: {agent_stats['llm_calls']}")
-            report.append(f"  Tool Calls: {agent_stats['tool_calls']}")
-            if agent_stats['execution_times']:
-                report.append(f"  Avg Execution Time: {agent_stats['avg_execution_time']:.2f}s")
-                report.append(f"  Max Execution Time: {agent_stats['max_execution_time']:.2f}s")
+            w(
+                f"\n{agent_name}:\n"
+                f"  Calls: {agent_stats['calls']}\n"
+                f"  LLM Calls: {agent_stats['llm_calls']}\n"
+                f"  Tool Calls: {agent_stats['tool_calls']}\n"
+            )
+            if agent_stats['execution_count']:
+                w(
+                    f"  Avg Execution Time: {agent_stats['avg_execution_time']:.2f}s\n"
+                    f"  Max Execution Time: {agent_stats['max_execution_time']:.2f}s\n"
+                )
         
-        report.append("\n" + "=" * 80)
+        w(f"\n{heavy}")
         
-        return "\n".join(report)
+        return buf.getvalue()
     
     def save_report(self, output_file: Path):
         """Save analysis report to file"""
@@ -111,8 +191,9 @@ def analyze_logs(log_file: str = "workflow_execution.jsonl"):
     """Convenience function to analyze logs"""
     log_path = Path("./logs") / log_file
     analyzer = LogAnalyzer(log_path)
+    analyzer.stream_statistics()
     
-    if analyzer.events:
+    if analyzer.event_count:
         print(analyzer.get_summary_report())
         
         # Save to file
@@ -3,7 +3,8 @@ A2A Protocol Implementation
 Agent-to-Agent communication following official A2A specification
 """
 
-from .agent_card import AgentCard, RESUME_OPTIMIZER_AGENT_CARD
+from . import agent_card as _agent_card
+from .agent_card import AgentCard, get_agent_card
 from .messages import (
     A2AMessage,
     A2ATask,
@@ -17,6 +18,8 @@ from .client import A2AClient
 __all__ = [
     "AgentCard",
     "RESUME_OPTIMIZER_AGENT_CARD",
+    "RESUME_OPTIMIZER_AGENT_CARD_BYTES",
+    "get_agent_card",
     "A2AMessage",
     "A2ATask",
     "JSONRPCRequest",
@@ -25,3 +28,13 @@ __all__ = [
     "TaskStatus",
     "A2AClient",
 ]
+
+# Built lazily by agent_card on first access; forwarded the same way here
+_LAZY_CARD_EXPORTS = ("RESUME_OPTIMIZER_AGENT_CARD", "RESUME_OPTIMIZER_AGENT_CARD_BYTES")
+
+
+def __getattr__(name):
+    """Resolve the lazily built agent card constants on first access"""
+    if name in _LAZY_CARD_EXPORTS:
+        return getattr(_agent_card, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,16 @@
 Agent Card Implementation
 Compliant with A2A Protocol Specification
 """
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
+import functools
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class TransportType(str, Enum):
@@ -13,25 +20,46 @@ class TransportType(str, Enum):
     HTTP_JSON = "http+json"
 
 
+# Plain dict lookup, skipping EnumMeta.__call__ when converting wire values
+_TRANSPORT_LOOKUP = {transport.value: transport for transport in TransportType}
+_VALID_TRANSPORTS = frozenset(_TRANSPORT_LOOKUP)
+
+
+def _transport(value: Any) -> TransportType:
+    """Convert a wire value to TransportType, raising ValueError if unknown"""
+    return _TRANSPORT_LOOKUP.get(value) or TransportType(value)
+
+
+# The card is a published constant: immutable, and tolerant of extra keys
+# from newer peers. Mutable defaults use factories instead of copied literals.
+_CARD_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
+
 class SecurityScheme(BaseModel):
+    model_config = _CARD_MODEL_CONFIG
+    
     type: str  # "bearer", "apiKey", "oauth2"
     scheme: Optional[str] = None
     bearerFormat: Optional[str] = None
 
 
 class SkillInputOutput(BaseModel):
+    model_config = _CARD_MODEL_CONFIG
+    
     type: str = "object"
     properties: Dict[str, Any]
-    required: List[str] = []
+    required: List[str] = Field(default_factory=list)
 
 
 class AgentSkill(BaseModel):
+    model_config = _CARD_MODEL_CONFIG
+    
     id: str
     name: str
     description: str
     inputSchema: SkillInputOutput
     outputSchema: SkillInputOutput
-    examples: List[Dict[str, Any]] = []
+    examples: List[Dict[str, Any]] = Field(default_factory=list)
 
 
 class AgentCard(BaseModel):
@@ -39,27 +67,32 @@ class AgentCard(BaseModel):
     A2A Protocol Agent Card
     Published at /.well-known/agent-card.json
     """
+    model_config = _CARD_MODEL_CONFIG
+    
     id: str = Field(..., description="Unique agent identifier")
     name: str = Field(..., description="Human-readable agent name")
     description: str = Field(..., description="Agent purpose and capabilities")
     version: str = Field(default="1.0.0", description="Agent version")
     url: str = Field(..., description="Base URL for agent endpoints")
     
-    # Transport configuration
-    preferredTransport: TransportType = TransportType.JSONRPC
-    supportedTransports: List[TransportType] = [TransportType.JSONRPC]
+    # Transport configuration, kept as wire strings (TransportType values);
+    # the *_enum(s) properties give TransportType members on demand
+    preferredTransport: str = TransportType.JSONRPC.value
+    supportedTransports: List[str] = Field(
+        default_factory=lambda: [TransportType.JSONRPC.value]
+    )
     
     # Capabilities
     skills: List[AgentSkill] = Field(..., description="Agent skills/capabilities")
     
     # Security
-    securitySchemes: Dict[str, SecurityScheme] = {}
+    securitySchemes: Dict[str, SecurityScheme] = Field(default_factory=dict)
     
     # Metadata
     author: Optional[str] = None
     license: Optional[str] = None
     homepage: Optional[str] = None
-    tags: List[str] = []
+    tags: List[str] = Field(default_factory=list)
     
     # Service endpoints
     endpoints: Dict[str, str] = Field(
@@ -69,230 +102,331 @@ class AgentCard(BaseModel):
             "health": "/health"
         }
     )
+    
+    @field_validator("preferredTransport")
+    @classmethod
+    def _check_transport(cls, value: str) -> str:
+        if value not in _VALID_TRANSPORTS:
+            raise ValueError(f"Unknown transport: {value}")
+        return value
+    
+    @field_validator("supportedTransports")
+    @classmethod
+    def _check_transports(cls, value: List[str]) -> List[str]:
+        for transport in value:
+            if transport not in _VALID_TRANSPORTS:
+                raise ValueError(f"Unknown transport: {transport}")
+        return value
+    
+    @property
+    def preferred_transport_enum(self) -> TransportType:
+        """Preferred transport as a TransportType member"""
+        return _transport(self.preferredTransport)
+    
+    @property
+    def supported_transport_enums(self) -> Tuple[TransportType, ...]:
+        """Supported transports as TransportType members"""
+        return tuple(_transport(t) for t in self.supportedTransports)
 
 
 # Define Resume Optimizer Agent Card
-RESUME_OPTIMIZER_AGENT_CARD = AgentCard(
-    id="resume-optimizer-agent",
-    name="Resume Optimizer Agent",
-    description="AI-powered multi-agent system that optimizes resumes for ATS compatibility and job descriptions using MCP tools and Google ADK agents",
-    version="1.0.0",
-    url="http://localhost:8000",  # Update for production
-    preferredTransport=TransportType.JSONRPC,
-    supportedTransports=[TransportType.JSONRPC, TransportType.HTTP_JSON],
-    skills=[
-        AgentSkill(
-            id="optimize-resume",
-            name="Optimize Resume",
-            description="Optimize resume for a specific job description with ATS scoring, keyword enhancement, and Markdown formatting",
-            inputSchema=SkillInputOutput(
-                type="object",
-                properties={
-                    "resume_content": {
-                        "type": "string",
-                        "description": "Resume text or file content"
+@functools.cache
+def _build_resume_optimizer_card() -> AgentCard:
+    """Build the Resume Optimizer agent card, once, on first use"""
+    return AgentCard(
+        id="resume-optimizer-agent",
+        name="Resume Optimizer Agent",
+        description="AI-powered multi-agent system that optimizes resumes for ATS compatibility and job descriptions using MCP tools and Google ADK agents",
+        version="1.0.0",
+        url="http://localhost:8000",  # Update for production
+        preferredTransport=TransportType.JSONRPC,
+        supportedTransports=[TransportType.JSONRPC, TransportType.HTTP_JSON],
+        skills=[
+            AgentSkill(
+                id="optimize-resume",
+                name="Optimize Resume",
+                description="Optimize resume for a specific job description with ATS scoring, keyword enhancement, and Markdown formatting",
+                inputSchema=SkillInputOutput(
+                    type="object",
+                    properties={
+                        "resume_content": {
+                            "type": "string",
+                            "description": "Resume text or file content"
+                        },
+                        "job_description": {
+                            "type": "string",
+                            "description": "Target job description"
+                        },
+                        "job_url": {
+                            "type": "string",
+                            "description": "URL to job posting (optional)",
+                            "format": "uri"
+                        },
+                        "output_format": {
+                            "type": "string",
+                            "description": "Output format (markdown, pdf, docx)",
+                            "enum": ["markdown", "pdf", "docx"],
+                            "default": "markdown"
+                        }
                     },
-                    "job_description": {
-                        "type": "string",
-                        "description": "Target job description"
+                    required=["resume_content", "job_description"]
+                ),
+                outputSchema=SkillInputOutput(
+                    type="object",
+                    properties={
+                        "optimized_resume": {
+                            "type": "string",
+                            "description": "Optimized resume in Markdown format"
+                        },
+                        "ats_score": {
+                            "type": "number",
+                            "description": "ATS compatibility score (0-100)"
+                        },
+                        "quality_score": {
+                            "type": "number",
+                            "description": "Overall quality score (0-100)"
+                        },
+                        "keyword_analysis": {
+                            "type": "object",
+                            "description": "Keyword extraction results"
+                        },
+                        "recommendations": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Optimization recommendations"
+                        },
+                        "changes_made": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "List of changes applied"
+                        }
                     },
-                    "job_url": {
-                        "type": "string",
-                        "description": "URL to job posting (optional)",
-                        "format": "uri"
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "description": "Output format (markdown, pdf, docx)",
-                        "enum": ["markdown", "pdf", "docx"],
-                        "default": "markdown"
-                    }
-                },
-                required=["resume_content", "job_description"]
-            ),
-            outputSchema=SkillInputOutput(
-                type="object",
-                properties={
-                    "optimized_resume": {
-                        "type": "string",
-                        "description": "Optimized resume in Markdown format"
-                    },
-                    "ats_score": {
-                        "type": "number",
-                        "description": "ATS compatibility score (0-100)"
-                    },
-                    "quality_score": {
-                        "type": "number",
-                        "description": "Overall quality score (0-100)"
-                    },
-                    "keyword_analysis": {
-                        "type": "object",
-                        "description": "Keyword extraction results"
-                    },
-                    "recommendations": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optimization recommendations"
-                    },
-                    "changes_made": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of changes applied"
+                    required=["optimized_resume", "ats_score"]
+                ),
+                examples=[
+                    {
+                        "input": {
+                            "resume_content": "John Doe\nSoftware Engineer with 5 years experience in web development...",
+                            "job_description": "Looking for Senior Python Developer with AWS experience..."
+                        },
+                        "output": {
+                            "optimized_resume": "# John Doe\n## Senior Python Developer\n\n### Professional Summary\nSoftware Engineer specializing in Python development...",
+                            "ats_score": 87,
+                            "quality_score": 92,
+                            "recommendations": [
+                                "Added AWS and Python keywords",
+                                "Restructured experience section for ATS"
+                            ]
+                        }
                     }
-                },
-                required=["optimized_resume", "ats_score"]
+                ]
             ),
-            examples=[
-                {
-                    "input": {
-                        "resume_content": "John Doe\nSoftware Engineer with 5 years experience in web development...",
-                        "job_description": "Looking for Senior Python Developer with AWS experience..."
+            AgentSkill(
+                id="extract-job-description",
+                name="Extract Job Description",
+                description="Extract structured job information from URL or text using web scraping and NLP",
+                inputSchema=SkillInputOutput(
+                    type="object",
+                    properties={
+                        "job_url": {
+                            "type": "string",
+                            "description": "URL to job posting",
+                            "format": "uri"
+                        },
+                        "job_text": {
+                            "type": "string",
+                            "description": "Job description text (alternative to URL)"
+                        }
                     },
-                    "output": {
-                        "optimized_resume": "# John Doe\n## Senior Python Developer\n\n### Professional Summary\nSoftware Engineer specializing in Python development...",
-                        "ats_score": 87,
-                        "quality_score": 92,
-                        "recommendations": [
-                            "Added AWS and Python keywords",
-                            "Restructured experience section for ATS"
-                        ]
-                    }
-                }
-            ]
-        ),
-        AgentSkill(
-            id="extract-job-description",
-            name="Extract Job Description",
-            description="Extract structured job information from URL or text using web scraping and NLP",
-            inputSchema=SkillInputOutput(
-                type="object",
-                properties={
-                    "job_url": {
-                        "type": "string",
-                        "description": "URL to job posting",
-                        "format": "uri"
+                    required=[]
+                ),
+                outputSchema=SkillInputOutput(
+                    type="object",
+                    properties={
+                        "job_title": {"type": "string"},
+                        "company": {"type": "string"},
+                        "location": {"type": "string"},
+                        "required_skills": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        },
+                        "preferred_skills": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        },
+                        "keywords": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        },
+                        "experience_level": {"type": "string"},
+                        "full_description": {"type": "string"}
                     },
-                    "job_text": {
-                        "type": "string",
-                        "description": "Job description text (alternative to URL)"
+                    required=["job_title", "required_skills"]
+                ),
+                examples=[
+                    {
+                        "input": {
+                            "job_url": "https://example.com/job/12345"
+                        },
+                        "output": {
+                            "job_title": "Senior Python Developer",
+                            "company": "Tech Corp",
+                            "required_skills": ["Python", "AWS", "Docker", "REST APIs"],
+                            "keywords": ["backend", "microservices", "cloud"]
+                        }
                     }
-                },
-                required=[]
-            ),
-            outputSchema=SkillInputOutput(
-                type="object",
-                properties={
-                    "job_title": {"type": "string"},
-                    "company": {"type": "string"},
-                    "location": {"type": "string"},
-                    "required_skills": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "preferred_skills": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "keywords": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    },
-                    "experience_level": {"type": "string"},
-                    "full_description": {"type": "string"}
-                },
-                required=["job_title", "required_skills"]
+                ]
             ),
-            examples=[
-                {
-                    "input": {
-                        "job_url": "https://example.com/job/12345"
+            AgentSkill(
+                id="calculate-ats-score",
+                name="Calculate ATS Score",
+                description="Calculate ATS compatibility score for resume-job pair using MCP tools",
+                inputSchema=SkillInputOutput(
+                    type="object",
+                    properties={
+                        "resume_text": {
+                            "type": "string",
+                            "description": "Resume content"
+                        },
+                        "job_description": {
+                            "type": "string",
+                            "description": "Job description"
+                        }
                     },
-                    "output": {
-                        "job_title": "Senior Python Developer",
-                        "company": "Tech Corp",
-                        "required_skills": ["Python", "AWS", "Docker", "REST APIs"],
-                        "keywords": ["backend", "microservices", "cloud"]
-                    }
-                }
-            ]
-        ),
-        AgentSkill(
-            id="calculate-ats-score",
-            name="Calculate ATS Score",
-            description="Calculate ATS compatibility score for resume-job pair using MCP tools",
-            inputSchema=SkillInputOutput(
-                type="object",
-                properties={
-                    "resume_text": {
-                        "type": "string",
-                        "description": "Resume content"
+                    required=["resume_text", "job_description"]
+                ),
+                outputSchema=SkillInputOutput(
+                    type="object",
+                    properties={
+                        "total_score": {
+                            "type": "number",
+                            "description": "Overall ATS score (0-100)"
+                        },
+                        "keyword_score": {
+                            "type": "number",
+                            "description": "Keyword match score"
+                        },
+                        "skills_score": {
+                            "type": "number",
+                            "description": "Skills match score"
+                        },
+                        "experience_score": {
+                            "type": "number",
+                            "description": "Experience relevance score"
+                        },
+                        "format_score": {
+                            "type": "number",
+                            "description": "Formatting quality score"
+                        },
+                        "missing_keywords": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Keywords from job not found in resume"
+                        },
+                        "matched_skills": {
+                            "type": "array",
+                            "items": {"type": "string"}
+                        }
                     },
-                    "job_description": {
-                        "type": "string",
-                        "description": "Job description"
+                    required=["total_score"]
+                ),
+                examples=[
+                    {
+                        "input": {
+                            "resume_text": "Python developer with AWS experience...",
+                            "job_description": "Looking for Python developer..."
+                        },
+                        "output": {
+                            "total_score": 87,
+                            "keyword_score": 35,
+                            "skills_score": 28,
+                            "experience_score": 24
+                        }
                     }
-                },
-                required=["resume_text", "job_description"]
-            ),
-            outputSchema=SkillInputOutput(
-                type="object",
-                properties={
-                    "total_score": {
-                        "type": "number",
-                        "description": "Overall ATS score (0-100)"
-                    },
-                    "keyword_score": {
-                        "type": "number",
-                        "description": "Keyword match score"
-                    },
-                    "skills_score": {
-                        "type": "number",
-                        "description": "Skills match score"
-                    },
-                    "experience_score": {
-                        "type": "number",
-                        "description": "Experience relevance score"
-                    },
-                    "format_score": {
-                        "type": "number",
-                        "description": "Formatting quality score"
-                    },
-                    "missing_keywords": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Keywords from job not found in resume"
-                    },
-                    "matched_skills": {
-                        "type": "array",
-                        "items": {"type": "string"}
-                    }
-                },
-                required=["total_score"]
-            ),
-            examples=[
-                {
-                    "input": {
-                        "resume_text": "Python developer with AWS experience...",
-                        "job_description": "Looking for Python developer..."
-                    },
-                    "output": {
-                        "total_score": 87,
-                        "keyword_score": 35,
-                        "skills_score": 28,
-                        "experience_score": 24
-                    }
-                }
-            ]
-        )
-    ],
-    securitySchemes={
-        "bearerAuth": SecurityScheme(
-            type="http",
-            scheme="bearer",
-            bearerFormat="JWT"
-        )
-    },
-    author="Resume Optimizer Team",
-    license="MIT",
-    tags=["resume", "ats", "optimization", "career", "job-search", "ai-agent"]
-)
+                ]
+            )
+        ],
+        securitySchemes={
+            "bearerAuth": SecurityScheme(
+                type="http",
+                scheme="bearer",
+                bearerFormat="JWT"
+            )
+        },
+        author="Resume Optimizer Team",
+        license="MIT",
+        tags=["resume", "ats", "optimization", "career", "job-search", "ai-agent"]
+    )
+
+
+# Cached field-name sets for model_construct, so it need not build one from
+# each payload's keys. Cards are serialized whole, so every field is "set".
+_SECURITY_SCHEME_FIELDS = frozenset(SecurityScheme.model_fields)
+_SKILL_IO_FIELDS = frozenset(SkillInputOutput.model_fields)
+_SKILL_FIELDS = frozenset(AgentSkill.model_fields)
+_AGENT_CARD_FIELDS = frozenset(AgentCard.model_fields)
+
+
+def construct_agent_card(data: Dict[str, Any], validate: bool = False) -> AgentCard:
+    """
+    Build an AgentCard from its JSON form
+    
+    Without validation the nested models are constructed by hand, since
+    model_construct does not recurse into skills or security schemes.
+    """
+    if validate:
+        return AgentCard(**data)
+    data = dict(data)
+    data["skills"] = [
+        AgentSkill.model_construct(_SKILL_FIELDS, **{
+            **skill,
+            "inputSchema": SkillInputOutput.model_construct(_SKILL_IO_FIELDS, **skill["inputSchema"]),
+            "outputSchema": SkillInputOutput.model_construct(_SKILL_IO_FIELDS, **skill["outputSchema"]),
+        })
+        for skill in data.get("skills", ())
+    ]
+    if "securitySchemes" in data:
+        data["securitySchemes"] = {
+            name: SecurityScheme.model_construct(_SECURITY_SCHEME_FIELDS, **scheme)
+            for name, scheme in data["securitySchemes"].items()
+        }
+    return AgentCard.model_construct(_AGENT_CARD_FIELDS, **data)
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@functools.cache
+def _resume_optimizer_card_bytes() -> bytes:
+    """Serialize the constant card once, on first use"""
+    card = _build_resume_optimizer_card()
+    if orjson is not None:
+        return orjson.dumps(card.dict())
+    return card.json().encode('utf-8')
+
+
+# The card and its bytes are built on first access instead of at import, so
+# processes that only use the client never construct or serialize them
+_LAZY_CONSTANTS = {
+    "RESUME_OPTIMIZER_AGENT_CARD": _build_resume_optimizer_card,
+    "RESUME_OPTIMIZER_AGENT_CARD_BYTES": _resume_optimizer_card_bytes,
+}
+
+
+def __getattr__(name):
+    """Build RESUME_OPTIMIZER_AGENT_CARD(_BYTES) on first access"""
+    builder = _LAZY_CONSTANTS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+
+def get_agent_card() -> AgentCard:
+    """
+    Get a private copy of the Resume Optimizer agent card
+    
+    Parsed from the cached JSON bytes without re-running validation. Cards
+    are frozen; use model_copy(update=...) to derive one with e.g. another url.
+    """
+    return construct_agent_card(_loads(_resume_optimizer_card_bytes()))
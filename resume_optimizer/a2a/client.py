@@ -2,52 +2,254 @@
 A2A Protocol Client
 For communicating with other A2A-compliant agents
 """
+import asyncio
 import httpx
-from typing import Dict, Any, Optional, List
+import itertools
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import h2  # noqa: F401  (enables httpx's HTTP/2 support)
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 from .messages import (
-    JSONRPCRequest, JSONRPCResponse, A2AMessage, 
-    MessageRole, TextPart, A2ATask
+    JSONRPCResponse, MessageRole, A2ATask, TaskStatus
 )
-from .agent_card import AgentCard
+from .agent_card import AgentCard, construct_agent_card
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Endpoint paths, resolved against the shared client's base_url
+_AGENT_CARD_PATH = "/.well-known/agent-card.json"
+_MESSAGE_SEND_PATH = "/v1/message:send"
+_TASKS_PATH = "/v1/tasks"
+_TASK_PATH_PREFIX = _TASKS_PATH + "/"
+_SKILLS_PATH = "/v1/skills"
+_HEALTH_PATH = "/health"
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+
+# Both parsers accept the raw response bytes, so no intermediate str decode
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Constant part of every message/send request; only params and id vary
+_RPC_ENVELOPE = {"jsonrpc": "2.0", "method": "message/send"}
+_USER_ROLE = MessageRole.USER.value
+
+# Discovered cards per (base URL, validate), as (etag, card) in LRU order;
+# the etag may be empty
+_AGENT_CARD_CACHE: "OrderedDict[Tuple[str, bool], Tuple[str, AgentCard]]" = OrderedDict()
+_AGENT_CARD_CACHE_SIZE = 64
+
+_TASK_DATETIME_FIELDS = ("created_at", "updated_at", "completed_at")
+_TASK_STATUS_LOOKUP = {status.value: status for status in TaskStatus}
+# Servers send whole task dumps, so the full field set can be reused as-is
+_TASK_FIELDS = frozenset(A2ATask.model_fields)
+
+
+def _build_task(data: Dict[str, Any], validate: bool = False) -> A2ATask:
+    """
+    Build an A2ATask from a server response
+    
+    Without validation only the status enum and timestamps are converted.
+    """
+    if validate:
+        return A2ATask(**data)
+    data = dict(data)
+    status = data["status"]
+    data["status"] = _TASK_STATUS_LOOKUP.get(status) or TaskStatus(status)
+    for field in _TASK_DATETIME_FIELDS:
+        value = data.get(field)
+        if isinstance(value, str):
+            data[field] = datetime.fromisoformat(value)
+    return A2ATask.model_construct(_TASK_FIELDS, **data)
+
+
+if msgspec is not None:
+    class _A2ATaskWire(msgspec.Struct, kw_only=True, gc=False):
+        """Wire mirror of A2ATask, decoded and type-checked in C by msgspec"""
+        id: str
+        status: TaskStatus
+        skill_id: str
+        input: Dict[str, Any]
+        output: Optional[Dict[str, Any]] = None
+        error: Optional[str] = None
+        created_at: datetime
+        updated_at: datetime
+        completed_at: Optional[datetime] = None
+    
+    class _TaskResultWire(msgspec.Struct, gc=False):
+        task: _A2ATaskWire
+    
+    class _TaskPageWire(msgspec.Struct, gc=False):
+        tasks: List[_A2ATaskWire]
+        total: Optional[int] = None
+    
+    _TASK_RESULT_DECODER = msgspec.json.Decoder(_TaskResultWire)
+    _TASK_PAGE_DECODER = msgspec.json.Decoder(_TaskPageWire)
+    _wire_fields = msgspec.structs.asdict
+
+
+def _from_wire(wire: "_A2ATaskWire") -> A2ATask:
+    """Convert a decoded wire task into the public A2ATask model"""
+    return A2ATask.model_construct(_TASK_FIELDS, **_wire_fields(wire))
+
+
+def _decode_task(content: bytes, validate: bool = False) -> A2ATask:
+    """Decode a {"task": ...} response body, via msgspec when installed"""
+    if msgspec is None or validate:
+        return _build_task(_loads(content)["task"], validate)
+    return _from_wire(_TASK_RESULT_DECODER.decode(content).task)
+
+
+def _decode_task_page(
+    content: bytes,
+    validate: bool = False
+) -> Tuple[List[A2ATask], Optional[int]]:
+    """Decode a task list response body into (tasks, total)"""
+    if msgspec is None or validate:
+        result = _loads(content)
+        return [_build_task(task, validate) for task in result["tasks"]], result.get("total")
+    page = _TASK_PAGE_DECODER.decode(content)
+    return [_from_wire(task) for task in page.tasks], page.total
 
 
 class A2AClient:
     """
     Client for A2A Protocol communication
     Discovers agents and sends messages via JSON-RPC
+    
+    Methods share one pooled HTTP client and are safe to run concurrently
+    (e.g. with asyncio.gather) on the same instance.
     """
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30, validate: bool = False):
         """
         Initialize A2A client
         
+        Requests share one pooled connection, using HTTP/2 when the `h2`
+        package is installed (httpx[http2]) and HTTP/1.1 otherwise. Failed
+        connection attempts are retried twice with backoff.
+        
         Args:
             base_url: Base URL of the A2A agent (e.g., "http://localhost:8000")
             timeout: Request timeout in seconds
+            validate: Run full pydantic validation on agent cards and tasks
+                returned by the server instead of trusting them as-is
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.validate = validate
+        self._request_ids = itertools.count(1)
+        self._skill_validators: Dict[str, Any] = {}
+        self._skill_validators_card: Optional[AgentCard] = None
         self.agent_card: Optional[AgentCard] = None
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use
+        
+        Reusing one client keeps connections alive across calls instead of
+        reconnecting for every request.
+        """
+        if self._client is None or self._client.is_closed:
+            # Pool settings belong on the transport once a custom one is given
+            transport = httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=60.0
+                ),
+                retries=2
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout),
+                transport=transport
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "A2AClient":
+        await self._get_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
     
     async def discover_agent(self) -> AgentCard:
         """
         Discover agent via Agent Card
         Fetches /.well-known/agent-card.json
         
+        Cards are cached per base URL and validation mode (so a card built
+        without validation is never handed to a validating client), keeping
+        the most recently used entries. A cached card is revalidated with
+        If-None-Match when the server sent an ETag, or reused when the
+        fetched card reports the same id and version.
+        
         Returns:
             AgentCard object with agent capabilities
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/.well-known/agent-card.json",
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            self.agent_card = AgentCard(**response.json())
+        client = await self._get_client()
+        cache_key = (self.base_url, self.validate)
+        cached = _AGENT_CARD_CACHE.get(cache_key)
+        headers = {"if-none-match": cached[0]} if cached and cached[0] else None
+        response = await client.get(_AGENT_CARD_PATH, headers=headers)
+        
+        if cached and response.status_code == 304:
+            self.agent_card = cached[1]
             return self.agent_card
+        if not response.is_success:
+            response.raise_for_status()
+        
+        data = _loads(response.content)
+        if (
+            cached
+            and data.get("id") == cached[1].id
+            and data.get("version") == cached[1].version
+        ):
+            card = cached[1]
+        else:
+            card = construct_agent_card(data, self.validate)
+        _AGENT_CARD_CACHE[cache_key] = (response.headers.get("etag", ""), card)
+        _AGENT_CARD_CACHE.move_to_end(cache_key)
+        if len(_AGENT_CARD_CACHE) > _AGENT_CARD_CACHE_SIZE:
+            _AGENT_CARD_CACHE.popitem(last=False)
+        self.agent_card = card
+        return self.agent_card
     
     async def send_message(
         self,
@@ -68,16 +270,15 @@ class A2AClient:
         Returns:
             Response from agent
         """
-        # Create A2A message
-        a2a_message = A2AMessage(
-            role=MessageRole.USER,
-            author=author,
-            parts=[TextPart(text=message)]
-        )
-        
-        # Build params
+        # Build the A2AMessage wire form directly; its fields need no validation
         params = {
-            "message": json.loads(a2a_message.json()),
+            "message": {
+                "role": _USER_ROLE,
+                "author": author,
+                "parts": [{"type": "text", "text": message}],
+                "timestamp": None,
+                "metadata": {}
+            },
         }
         
         if skill_id:
@@ -87,29 +288,31 @@ class A2AClient:
             params.update(additional_params)
         
         # Create JSON-RPC request
-        rpc_request = JSONRPCRequest(
-            method="message/send",
-            params=params,
-            id=f"req-{hash(message)}"
-        )
+        rpc_request = {
+            **_RPC_ENVELOPE,
+            "params": params,
+            "id": f"req-{next(self._request_ids)}"
+        }
         
         # Send request
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/v1/message:send",
-                json=json.loads(rpc_request.json()),
-                timeout=self.timeout
-            )
+        client = await self._get_client()
+        response = await client.post(
+            _MESSAGE_SEND_PATH,
+            content=_dumps(rpc_request),
+            headers=_JSON_HEADERS
+        )
+        if not response.is_success:
             response.raise_for_status()
-            
-            rpc_response = JSONRPCResponse(**response.json())
-            
-            if rpc_response.error:
-                raise Exception(
-                    f"RPC Error [{rpc_response.error.code}]: {rpc_response.error.message}"
-                )
-            
-            return rpc_response.result
+        
+        # Only the error branch needs the validated response model
+        result = _loads(response.content)
+        if result.get("error"):
+            rpc_response = JSONRPCResponse(**result)
+            raise Exception(
+                f"RPC Error [{rpc_response.error.code}]: {rpc_response.error.message}"
+            )
+        
+        return result.get("result")
     
     async def invoke_skill(
         self,
@@ -128,6 +331,13 @@ class A2AClient:
         Returns:
             Skill execution result
         """
+        validator = self._get_skill_validator(skill_id)
+        if validator is not None:
+            try:
+                validator(input_data)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Invalid input for skill '{skill_id}': {e.message}") from e
+        
         # Create message with structured input
         message_text = json.dumps(input_data)
         
@@ -138,6 +348,51 @@ class A2AClient:
             additional_params={"input": input_data}
         )
     
+    def _get_skill_validator(self, skill_id: str):
+        """
+        Get the compiled input-schema validator for a discovered skill
+        
+        Validators are compiled with fastjsonschema once per discovered agent
+        card, so invalid input fails locally instead of after a round trip.
+        Schema defaults are not filled in, so validating never changes the
+        caller's input.
+        Returns None when fastjsonschema is not installed, no card has been
+        discovered, or the skill is unknown.
+        """
+        if fastjsonschema is None or self.agent_card is None:
+            return None
+        if self._skill_validators_card is not self.agent_card:
+            self._skill_validators = {
+                skill.id: fastjsonschema.compile({
+                    "type": "object",
+                    "properties": skill.inputSchema.properties,
+                    "required": skill.inputSchema.required
+                }, use_default=False)
+                for skill in self.agent_card.skills
+            }
+            self._skill_validators_card = self.agent_card
+        return self._skill_validators.get(skill_id)
+    
+    async def batch_invoke(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        author: str = "client-user"
+    ) -> List[Dict[str, Any]]:
+        """
+        Invoke several skills concurrently over the shared connection pool
+        
+        Args:
+            calls: (skill_id, input_data) pairs to invoke
+            author: Message author identifier
+        
+        Returns:
+            Skill execution results, in the same order as `calls`
+        """
+        return await asyncio.gather(*(
+            self.invoke_skill(skill_id, input_data, author=author)
+            for skill_id, input_data in calls
+        ))
+    
     async def create_task(
         self,
         skill_id: str,
@@ -153,19 +408,19 @@ class A2AClient:
         Returns:
             Task object with tracking ID
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/v1/tasks",
-                json={
-                    "skill_id": skill_id,
-                    "input": input_data
-                },
-                timeout=self.timeout
-            )
+        client = await self._get_client()
+        response = await client.post(
+            _TASKS_PATH,
+            content=_dumps({
+                "skill_id": skill_id,
+                "input": input_data
+            }),
+            headers=_JSON_HEADERS
+        )
+        if not response.is_success:
             response.raise_for_status()
-            
-            result = response.json()
-            return A2ATask(**result["task"])
+        
+        return _decode_task(response.content, self.validate)
     
     async def get_task(self, task_id: str) -> A2ATask:
         """
@@ -177,15 +432,12 @@ class A2AClient:
         Returns:
             Task object with current status
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/v1/tasks/{task_id}",
-                timeout=self.timeout
-            )
+        client = await self._get_client()
+        response = await client.get(_TASK_PATH_PREFIX + task_id)
+        if not response.is_success:
             response.raise_for_status()
-            
-            result = response.json()
-            return A2ATask(**result["task"])
+        
+        return _decode_task(response.content, self.validate)
     
     async def list_tasks(
         self,
@@ -204,20 +456,58 @@ class A2AClient:
         Returns:
             List of tasks
         """
-        async with httpx.AsyncClient() as client:
-            params = {"limit": limit, "offset": offset}
-            if status:
-                params["status"] = status
-            
-            response = await client.get(
-                f"{self.base_url}/v1/tasks",
-                params=params,
-                timeout=self.timeout
+        tasks, _ = _decode_task_page(
+            await self._fetch_tasks(status, limit, offset), self.validate
+        )
+        return tasks
+    
+    async def iter_tasks(
+        self,
+        status: Optional[str] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[A2ATask]:
+        """
+        Iterate over all tasks, fetching them one page at a time
+        
+        Args:
+            status: Filter by status (pending, in_progress, completed, failed, cancelled)
+            page_size: Number of tasks requested per page
+        
+        Yields:
+            Tasks in server order, without holding more than one page
+        """
+        validate = self.validate
+        offset = 0
+        while True:
+            tasks, total = _decode_task_page(
+                await self._fetch_tasks(status, page_size, offset), validate
             )
+            for task in tasks:
+                yield task
+            offset += len(tasks)
+            if len(tasks) < page_size or (total is not None and offset >= total):
+                return
+    
+    async def _fetch_tasks(
+        self,
+        status: Optional[str],
+        limit: int,
+        offset: int
+    ) -> bytes:
+        """Fetch one page of tasks from /v1/tasks as the raw response body"""
+        client = await self._get_client()
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        
+        response = await client.get(
+            _TASKS_PATH,
+            params=params
+        )
+        if not response.is_success:
             response.raise_for_status()
-            
-            result = response.json()
-            return [A2ATask(**task) for task in result["tasks"]]
+        
+        return response.content
     
     async def cancel_task(self, task_id: str) -> A2ATask:
         """
@@ -229,15 +519,12 @@ class A2AClient:
         Returns:
             Updated task object
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/v1/tasks/{task_id}",
-                timeout=self.timeout
-            )
+        client = await self._get_client()
+        response = await client.delete(_TASK_PATH_PREFIX + task_id)
+        if not response.is_success:
             response.raise_for_status()
-            
-            result = response.json()
-            return A2ATask(**result["task"])
+        
+        return _decode_task(response.content, self.validate)
     
     async def list_skills(self) -> List[Dict[str, Any]]:
         """
@@ -246,15 +533,13 @@ class A2AClient:
         Returns:
             List of skill definitions
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/v1/skills",
-                timeout=self.timeout
-            )
+        client = await self._get_client()
+        response = await client.get(_SKILLS_PATH)
+        if not response.is_success:
             response.raise_for_status()
-            
-            result = response.json()
-            return result["skills"]
+        
+        result = _loads(response.content)
+        return result["skills"]
     
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -263,13 +548,11 @@ class A2AClient:
         Returns:
             Health status information
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/health",
-                timeout=self.timeout
-            )
+        client = await self._get_client()
+        response = await client.get(_HEALTH_PATH)
+        if not response.is_success:
             response.raise_for_status()
-            return response.json()
+        return _loads(response.content)
 
 
 # Example usage
@@ -278,60 +561,60 @@ async def example_usage():
     Example: Using A2A Client to communicate with Resume Optimizer Agent
     """
     # Create client
-    client = A2AClient("http://localhost:8000")
-    
-    # Discover agent
-    print("Discovering agent...")
-    agent_card = await client.discover_agent()
-    print(f"Connected to: {agent_card.name}")
-    print(f"Description: {agent_card.description}")
-    print(f"Skills: {[s.name for s in agent_card.skills]}\n")
-    
-    # List available skills
-    print("Listing skills...")
-    skills = await client.list_skills()
-    for skill in skills:
-        print(f"- {skill['name']}: {skill['description']}")
-    print()
-    
-    # Invoke optimize-resume skill
-    print("Invoking optimize-resume skill...")
-    response = await client.invoke_skill(
-        skill_id="optimize-resume",
-        input_data={
-            "resume_content": "John Doe\nSoftware Engineer with 5 years experience...",
-            "job_description": "Looking for Senior Python Developer with AWS experience..."
-        }
-    )
-    print(f"ATS Score: {response.get('result', {}).get('ats_score')}")
-    print(f"Quality Score: {response.get('result', {}).get('quality_score')}\n")
-    
-    # Create async task
-    print("Creating async task...")
-    task = await client.create_task(
-        skill_id="calculate-ats-score",
-        input_data={
-            "resume_text": "Python developer with cloud experience...",
-            "job_description": "Looking for Python developer..."
-        }
-    )
-    print(f"Task created: {task.id}")
-    print(f"Status: {task.status}\n")
-    
-    # Check task status
-    print("Checking task status...")
-    task_status = await client.get_task(task.id)
-    print(f"Task {task_status.id}: {task_status.status}")
-    if task_status.output:
-        print(f"Result: {task_status.output}")
-    
-    # Health check
-    print("\nHealth check...")
-    health = await client.health_check()
-    print(f"Status: {health['status']}")
-    print(f"Version: {health['version']}")
+    async with A2AClient("http://localhost:8000") as client:
+        # Discover agent, list skills and check health concurrently
+        print("Discovering agent...")
+        agent_card, skills, health = await asyncio.gather(
+            client.discover_agent(),
+            client.list_skills(),
+            client.health_check()
+        )
+        print(f"Connected to: {agent_card.name}")
+        print(f"Description: {agent_card.description}")
+        print(f"Skills: {[s.name for s in agent_card.skills]}\n")
+        
+        # List available skills
+        print("Listing skills...")
+        for skill in skills:
+            print(f"- {skill['name']}: {skill['description']}")
+        print()
+        
+        # Invoke optimize-resume skill
+        print("Invoking optimize-resume skill...")
+        response = await client.invoke_skill(
+            skill_id="optimize-resume",
+            input_data={
+                "resume_content": "John Doe\nSoftware Engineer with 5 years experience...",
+                "job_description": "Looking for Senior Python Developer with AWS experience..."
+            }
+        )
+        print(f"ATS Score: {response.get('result', {}).get('ats_score')}")
+        print(f"Quality Score: {response.get('result', {}).get('quality_score')}\n")
+        
+        # Create async task
+        print("Creating async task...")
+        task = await client.create_task(
+            skill_id="calculate-ats-score",
+            input_data={
+                "resume_text": "Python developer with cloud experience...",
+                "job_description": "Looking for Python developer..."
+            }
+        )
+        print(f"Task created: {task.id}")
+        print(f"Status: {task.status}\n")
+        
+        # Check task status
+        print("Checking task status...")
+        task_status = await client.get_task(task.id)
+        print(f"Task {task_status.id}: {task_status.status}")
+        if task_status.output:
+            print(f"Result: {task_status.output}")
+        
+        # Health check
+        print("\nHealth check...")
+        print(f"Status: {health['status']}")
+        print(f"Version: {health['version']}")
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(example_usage())
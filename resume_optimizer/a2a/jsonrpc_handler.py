@@ -2,19 +2,131 @@
 JSON-RPC 2.0 Handler for A2A Protocol
 Handles message/send, tasks/*, and other methods
 """
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from itertools import islice
+from typing import Dict, Any, Optional, Iterator
 import uuid
 from datetime import datetime
 import asyncio
+import os
+import re
+import time
 import traceback
 
 from .messages import (
     JSONRPCRequest, JSONRPCResponse, JSONRPCError, JSONRPCErrorCode,
-    A2AMessage, A2ATask, TaskStatus, MessageRole, TextPart
+    A2AMessage, A2ATask, TaskStatus, MessageRole, TextPart, construct_a2a_message
 )
 from .agent_card import RESUME_OPTIMIZER_AGENT_CARD
 
 
+# The card is immutable, so its skills/list and agent/info payloads are
+# dumped once; handlers hand out shallow copies so callers adding keys
+# (e.g. the server's timing metadata) never touch the shared dicts
+_SKILLS_LIST_RESULT = {
+    "skills": [skill.dict() for skill in RESUME_OPTIMIZER_AGENT_CARD.skills],
+    "total": len(RESUME_OPTIMIZER_AGENT_CARD.skills)
+}
+_AGENT_INFO_RESULT = {
+    "agent": RESUME_OPTIMIZER_AGENT_CARD.dict()
+}
+
+# Skill ids for O(1) membership checks; the list keeps card order for errors
+VALID_SKILL_IDS_LIST = [skill.id for skill in RESUME_OPTIMIZER_AGENT_CARD.skills]
+VALID_SKILL_IDS = frozenset(VALID_SKILL_IDS_LIST)
+
+# Keyword matching for the job-text and ATS fallbacks; the word pattern is
+# compiled once and applied to text that has already been lowercased
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_JOB_TEXT_KEYWORDS = ("python", "javascript", "java", "aws", "docker", "kubernetes", "react", "node")
+_TECH_SKILLS = frozenset({"python", "java", "javascript", "aws", "docker", "kubernetes", "react", "node", "sql", "nosql"})
+
+# Methods dispatched by A2AJSONRPCHandler.handle_request, listed in errors
+AVAILABLE_METHODS = [
+    "message/send",
+    "tasks/create",
+    "tasks/get",
+    "tasks/list",
+    "tasks/cancel",
+    "skills/list",
+    "agent/info",
+]
+
+
+class TaskStore:
+    """
+    Bounded in-memory task store with LRU eviction
+    
+    Finished tasks (completed, failed, cancelled) are dropped once they are
+    older than `ttl` seconds, and the least recently used finished tasks go
+    first when the store grows past `maxsize`. Pending and running tasks are
+    never evicted. Eviction runs lazily on insert; it never awaits, so it
+    needs no lock on the event loop.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._tasks: "OrderedDict[str, A2ATask]" = OrderedDict()
+        self._finished: Dict[str, float] = {}  # task_id -> monotonic finish time, oldest first
+        self._created: Dict[str, None] = {}  # task ids in creation order, for listing
+    
+    def __len__(self) -> int:
+        return len(self._tasks)
+    
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+    
+    def __getitem__(self, task_id: str) -> A2ATask:
+        task = self._tasks[task_id]
+        self._tasks.move_to_end(task_id)
+        return task
+    
+    def __setitem__(self, task_id: str, task: A2ATask):
+        if task_id not in self._tasks:
+            self._created[task_id] = None
+        self._tasks[task_id] = task
+        self._tasks.move_to_end(task_id)
+        self._evict()
+    
+    def values(self) -> Iterator[A2ATask]:
+        return iter(self._tasks.values())
+    
+    def newest_first(self) -> Iterator[A2ATask]:
+        """Iterate tasks by creation time, newest first, without touching LRU order"""
+        tasks = self._tasks
+        return (tasks[task_id] for task_id in reversed(self._created))
+    
+    def mark_finished(self, task_id: str):
+        """Record that a task reached a terminal state, starting its TTL"""
+        if task_id in self._tasks:
+            self._finished.pop(task_id, None)
+            self._finished[task_id] = time.monotonic()
+    
+    def _evict(self):
+        finished = self._finished
+        if finished:
+            cutoff = time.monotonic() - self.ttl
+            expired = []
+            for task_id, finished_at in finished.items():
+                if finished_at > cutoff:
+                    break
+                expired.append(task_id)
+            for task_id in expired:
+                del finished[task_id]
+                del self._tasks[task_id]
+                del self._created[task_id]
+        
+        overflow = len(self._tasks) - self.maxsize
+        if overflow > 0 and finished:
+            # Least recently used first; running tasks are skipped
+            victims = [task_id for task_id in self._tasks if task_id in finished][:overflow]
+            for task_id in victims:
+                del finished[task_id]
+                del self._tasks[task_id]
+                del self._created[task_id]
+
+
 class A2AJSONRPCHandler:
     """
     Handles JSON-RPC 2.0 requests for A2A Protocol
@@ -28,18 +140,9 @@ class A2AJSONRPCHandler:
             workflow: ResumeOptimizerWorkflow instance (optional, imported later to avoid circular deps)
         """
         self.workflow = workflow
-        self.tasks: Dict[str, A2ATask] = {}  # In-memory task store
-        
-        # Method registry
-        self.methods = {
-            "message/send": self.handle_message_send,
-            "tasks/create": self.handle_task_create,
-            "tasks/get": self.handle_task_get,
-            "tasks/list": self.handle_task_list,
-            "tasks/cancel": self.handle_task_cancel,
-            "skills/list": self.handle_skills_list,
-            "agent/info": self.handle_agent_info,
-        }
+        self.tasks = TaskStore()  # Bounded in-memory task store
+        # Formatting tracebacks walks every frame; only do it when debugging
+        self._include_traceback = bool(os.environ.get("A2A_DEBUG"))
     
     def set_workflow(self, workflow):
         """Set workflow instance after initialization"""
@@ -50,20 +153,32 @@ class A2AJSONRPCHandler:
         Route JSON-RPC request to appropriate handler
         """
         try:
-            # Validate method exists
-            if request.method not in self.methods:
-                return JSONRPCResponse(
-                    id=request.id,
-                    error=JSONRPCError(
-                        code=JSONRPCErrorCode.METHOD_NOT_FOUND,
-                        message=f"Method '{request.method}' not found",
-                        data={"available_methods": list(self.methods.keys())}
-                    )
-                )
-            
             # Call method handler
-            handler = self.methods[request.method]
-            result = await handler(request.params)
+            params = request.params
+            match request.method:
+                case "message/send":
+                    result = await self.handle_message_send(params)
+                case "tasks/create":
+                    result = await self.handle_task_create(params)
+                case "tasks/get":
+                    result = await self.handle_task_get(params)
+                case "tasks/list":
+                    result = await self.handle_task_list(params)
+                case "tasks/cancel":
+                    result = await self.handle_task_cancel(params)
+                case "skills/list":
+                    result = await self.handle_skills_list(params)
+                case "agent/info":
+                    result = await self.handle_agent_info(params)
+                case _:
+                    return JSONRPCResponse(
+                        id=request.id,
+                        error=JSONRPCError(
+                            code=JSONRPCErrorCode.METHOD_NOT_FOUND,
+                            message=f"Method '{request.method}' not found",
+                            data={"available_methods": list(AVAILABLE_METHODS)}
+                        )
+                    )
             
             return JSONRPCResponse(
                 id=request.id,
@@ -76,7 +191,8 @@ class A2AJSONRPCHandler:
                 error=JSONRPCError(
                     code=JSONRPCErrorCode.INVALID_PARAMS,
                     message=str(e),
-                    data={"params_received": request.params}
+                    # Names only: echoing values would send large inputs straight back
+                    data={"params_received": list(request.params)}
                 )
             )
         except Exception as e:
@@ -85,7 +201,11 @@ class A2AJSONRPCHandler:
                 error=JSONRPCError(
                     code=JSONRPCErrorCode.INTERNAL_ERROR,
                     message=f"Internal error: {str(e)}",
-                    data={"traceback": traceback.format_exc()}
+                    data=(
+                        {"traceback": traceback.format_exc()}
+                        if self._include_traceback
+                        else {"type": type(e).__name__}
+                    )
                 )
             )
     
@@ -99,15 +219,14 @@ class A2AJSONRPCHandler:
         if not message_data:
             raise ValueError("Missing 'message' parameter")
         
-        message = A2AMessage(**message_data)
+        message = construct_a2a_message(message_data)
         
         # Extract skill/intent from message
         skill_id = params.get("skill_id", "optimize-resume")
         
         # Validate skill exists
-        valid_skills = [s.id for s in RESUME_OPTIMIZER_AGENT_CARD.skills]
-        if skill_id not in valid_skills:
-            raise ValueError(f"Unknown skill '{skill_id}'. Valid skills: {valid_skills}")
+        if skill_id not in VALID_SKILL_IDS:
+            raise ValueError(f"Unknown skill '{skill_id}'. Valid skills: {VALID_SKILL_IDS_LIST}")
         
         # Process based on skill
         if skill_id == "optimize-resume":
@@ -119,16 +238,17 @@ class A2AJSONRPCHandler:
         else:
             raise ValueError(f"Skill '{skill_id}' not implemented yet")
         
-        # Return response message
-        response_message = A2AMessage(
-            role=MessageRole.AGENT,
-            author="resume-optimizer-agent",
-            parts=[TextPart(text=str(result))],
-            timestamp=datetime.utcnow()
-        )
+        # Return response message, built directly in A2AMessage.dict() form
+        response_message = {
+            "role": MessageRole.AGENT,
+            "author": "resume-optimizer-agent",
+            "parts": [{"type": "text", "text": str(result)}],
+            "timestamp": datetime.utcnow(),
+            "metadata": {}
+        }
         
         return {
-            "message": response_message.dict(),
+            "message": response_message,
             "skill_id": skill_id,
             "result": result,
             "metadata": {
@@ -149,19 +269,19 @@ class A2AJSONRPCHandler:
         input_data = params.get("input", {})
         
         # Validate skill exists
-        valid_skills = [s.id for s in RESUME_OPTIMIZER_AGENT_CARD.skills]
-        if skill_id not in valid_skills:
-            raise ValueError(f"Unknown skill '{skill_id}'. Valid skills: {valid_skills}")
+        if skill_id not in VALID_SKILL_IDS:
+            raise ValueError(f"Unknown skill '{skill_id}'. Valid skills: {VALID_SKILL_IDS_LIST}")
         
-        # Create task
+        # Create task; one clock read stamps both fields
         task_id = f"task-{uuid.uuid4()}"
+        now = datetime.utcnow()
         task = A2ATask(
             id=task_id,
             status=TaskStatus.PENDING,
             skill_id=skill_id,
             input=input_data,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
         
         self.tasks[task_id] = task
@@ -188,18 +308,17 @@ class A2AJSONRPCHandler:
         limit = params.get("limit", 100)
         offset = params.get("offset", 0)
         
-        tasks = list(self.tasks.values())
+        # The store keeps creation order, so newest-first needs no sort
+        tasks = self.tasks.newest_first()
         
-        # Filter by status
+        # Filter by status, then paginate
         if status_filter:
             tasks = [t for t in tasks if t.status == status_filter]
-        
-        # Sort by created_at (newest first)
-        tasks.sort(key=lambda t: t.created_at, reverse=True)
-        
-        # Paginate
-        total = len(tasks)
-        tasks = tasks[offset:offset + limit]
+            total = len(tasks)
+            tasks = tasks[offset:offset + limit]
+        else:
+            total = len(self.tasks)
+            tasks = list(islice(tasks, offset, offset + limit))
         
         return {
             "tasks": [t.dict() for t in tasks],
@@ -223,21 +342,17 @@ class A2AJSONRPCHandler:
         
         task.status = TaskStatus.CANCELLED
         task.updated_at = datetime.utcnow()
+        self.tasks.mark_finished(task_id)
         
         return {"task": task.dict()}
     
     async def handle_skills_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle skills/list method"""
-        return {
-            "skills": [skill.dict() for skill in RESUME_OPTIMIZER_AGENT_CARD.skills],
-            "total": len(RESUME_OPTIMIZER_AGENT_CARD.skills)
-        }
+        return dict(_SKILLS_LIST_RESULT)
     
     async def handle_agent_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle agent/info method"""
-        return {
-            "agent": RESUME_OPTIMIZER_AGENT_CARD.dict()
-        }
+        return dict(_AGENT_INFO_RESULT)
     
     async def _execute_task(self, task_id: str):
         """Execute task asynchronously"""
@@ -258,13 +373,15 @@ class A2AJSONRPCHandler:
             
             task.status = TaskStatus.COMPLETED
             task.output = result
-            task.completed_at = datetime.utcnow()
             
         except Exception as e:
             task.status = TaskStatus.FAILED
             task.error = str(e)
         
         task.updated_at = datetime.utcnow()
+        if task.status == TaskStatus.COMPLETED:
+            task.completed_at = task.updated_at
+        self.tasks.mark_finished(task_id)
     
     async def _execute_optimize_resume(self, message: A2AMessage, params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute optimize-resume skill from message"""
@@ -435,10 +552,8 @@ class A2AJSONRPCHandler:
         # If job_text provided instead of URL, parse it
         if job_text:
             # Simple keyword extraction from text
-            keywords = []
-            for word in ["python", "javascript", "java", "aws", "docker", "kubernetes", "react", "node"]:
-                if word.lower() in job_text.lower():
-                    keywords.append(word)
+            job_text_lower = job_text.lower()
+            keywords = [word for word in _JOB_TEXT_KEYWORDS if word in job_text_lower]
             
             return {
                 "job_title": "Extracted from text",
@@ -503,18 +618,12 @@ class A2AJSONRPCHandler:
             
         except Exception as e:
             # Fallback: Simple keyword matching if MCP fails
-            import re
-            
-            # Extract keywords from job description
-            job_words = set(re.findall(r'\b[a-zA-Z]{3,}\b', job_description.lower()))
-            resume_words = set(re.findall(r'\b[a-zA-Z]{3,}\b', resume_text.lower()))
-            
-            # Common tech skills
-            tech_skills = {"python", "java", "javascript", "aws", "docker", "kubernetes", "react", "node", "sql", "nosql"}
+            job_words = set(_WORD_RE.findall(job_description.lower()))
+            resume_words = set(_WORD_RE.findall(resume_text.lower()))
             
             matched = job_words & resume_words
             missing = job_words - resume_words
-            matched_skills = list((matched & tech_skills))
+            matched_skills = list(matched & _TECH_SKILLS)
             
             # Calculate simple score
             match_ratio = len(matched) / len(job_words) if job_words else 0
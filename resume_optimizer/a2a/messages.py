@@ -6,6 +6,12 @@ from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional, Union, Literal
 from datetime import datetime
 from enum import Enum
+import json
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 
 class MessageRole(str, Enum):
@@ -69,11 +75,76 @@ class A2AMessage(BaseModel):
     parts: List[ContentPart] = Field(..., description="Message content parts")
     timestamp: Optional[datetime] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+# Part classes keyed by their "type" discriminator, for direct dispatch
+_PART_TYPES = {
+    "text": TextPart,
+    "image": ImagePart,
+    "file": FilePart,
+    "tool_call": ToolCallPart,
+    "tool_result": ToolResultPart,
+}
+_PART_REQUIRED_FIELDS = {
+    part_cls: frozenset(name for name, field in part_cls.model_fields.items() if field.is_required())
+    for part_cls in _PART_TYPES.values()
+}
+_ROLE_LOOKUP = {role.value: role for role in MessageRole}
+_MESSAGE_FIELDS = frozenset(A2AMessage.model_fields)
+
+
+def construct_a2a_message(data: Dict[str, Any]) -> A2AMessage:
+    """
+    Build an A2AMessage from its JSON form without full pydantic validation
+    
+    Each part is dispatched on its "type" key straight to the matching part
+    class, instead of pydantic trying every member of the ContentPart union.
+    Only the shape is checked: a non-object message or part, a missing
+    field, an unknown role or an unknown part type raises ValueError. Parts
+    without a type are treated as text.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Message must be an object")
+    try:
+        role = data["role"]
+        author = data["author"]
+        parts = data["parts"]
+    except KeyError as e:
+        raise ValueError(f"Message is missing required field '{e.args[0]}'") from None
+    
+    role_enum = _ROLE_LOOKUP.get(role) if isinstance(role, str) else None
+    if role_enum is None:
+        raise ValueError(f"Invalid message role {role!r}")
+    if not isinstance(author, str):
+        raise ValueError("Message 'author' must be a string")
+    if not isinstance(parts, list):
+        raise ValueError("Message 'parts' must be a list")
+    
+    built_parts = []
+    for part in parts:
+        if not isinstance(part, dict):
+            raise ValueError("Message parts must be objects")
+        part_type = part.get("type", "text")
+        part_cls = _PART_TYPES.get(part_type) if isinstance(part_type, str) else None
+        if part_cls is None:
+            raise ValueError(f"Unknown message part type {part_type!r}")
+        missing = _PART_REQUIRED_FIELDS[part_cls].difference(part)
+        if missing:
+            raise ValueError(f"Message part '{part_type}' is missing required field(s): {sorted(missing)}")
+        built_parts.append(part_cls.model_construct(**part))
+    
+    timestamp = data.get("timestamp")
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
+    return A2AMessage.model_construct(
+        _MESSAGE_FIELDS,
+        role=role_enum,
+        author=author,
+        parts=built_parts,
+        timestamp=timestamp,
+        metadata=data.get("metadata") or {}
+    )
 
 
 class TaskStatus(str, Enum):
@@ -98,11 +169,6 @@ class A2ATask(BaseModel):
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 # JSON-RPC 2.0 Models
@@ -130,6 +196,45 @@ class JSONRPCResponse(BaseModel):
     id: Union[str, int, None]
 
 
+_REQUEST_FIELDS = frozenset(JSONRPCRequest.model_fields)
+
+if msgspec is not None:
+    class _JSONRPCRequestWire(msgspec.Struct, kw_only=True, gc=False):
+        """Wire mirror of JSONRPCRequest, validated in C while decoding"""
+        jsonrpc: Literal["2.0"] = "2.0"
+        method: str
+        params: Dict[str, Any] = {}
+        id: Union[str, int]
+    
+    _REQUEST_DECODER = msgspec.json.Decoder(_JSONRPCRequestWire)
+
+
+def decode_jsonrpc_request(body: bytes) -> JSONRPCRequest:
+    """
+    Decode a raw JSON-RPC request body into a JSONRPCRequest
+    
+    With msgspec installed the bytes are parsed and validated in a single
+    pass, without building an intermediate dict for pydantic to re-check.
+    Malformed JSON raises json.JSONDecodeError on either path, so callers
+    can map it to a parse error; schema violations raise a ValueError.
+    """
+    if msgspec is None:
+        return JSONRPCRequest(**json.loads(body))
+    try:
+        wire = _REQUEST_DECODER.decode(body)
+    except msgspec.ValidationError as e:
+        raise ValueError(str(e)) from e
+    except msgspec.DecodeError as e:
+        raise json.JSONDecodeError(str(e), "", 0) from e
+    return JSONRPCRequest.model_construct(
+        _REQUEST_FIELDS,
+        jsonrpc=wire.jsonrpc,
+        method=wire.method,
+        params=wire.params,
+        id=wire.id
+    )
+
+
 # JSON-RPC Error Codes (from spec)
 class JSONRPCErrorCode:
     PARSE_ERROR = -32700
@@ -3,17 +3,46 @@ A2A Protocol HTTP Server
 FastAPI implementation with JSON-RPC support
 """
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
+import hashlib
 import json
 import time
 
-from .agent_card import RESUME_OPTIMIZER_AGENT_CARD
-from .messages import JSONRPCRequest, JSONRPCResponse
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .agent_card import RESUME_OPTIMIZER_AGENT_CARD, RESUME_OPTIMIZER_AGENT_CARD_BYTES
+from .messages import JSONRPCRequest, JSONRPCResponse, decode_jsonrpc_request
 from .jsonrpc_handler import A2AJSONRPCHandler
 
+def _json_default(obj: Any) -> Any:
+    """Encode datetimes for the stdlib json fallback (orjson handles them natively)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a response body to JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def _sse_event(obj: Any) -> bytes:
+    """Frame an object as one Server-Sent Events data message"""
+    return b"data: " + _dumps(obj) + b"\n\n"
+
+
+# Strong validator for the constant card, so discovery can answer 304
+_AGENT_CARD_ETAG = '"%s"' % hashlib.sha256(RESUME_OPTIMIZER_AGENT_CARD_BYTES).hexdigest()[:32]
+_AGENT_CARD_HEADERS = {"ETag": _AGENT_CARD_ETAG}
 
 app = FastAPI(
     title="Resume Optimizer A2A Agent",
@@ -64,12 +93,21 @@ async def root():
 
 
 @app.get("/.well-known/agent-card.json")
-async def get_agent_card():
+async def get_agent_card(request: Request):
     """
     Agent Card Discovery Endpoint
     REQUIRED by A2A Protocol
+    
+    Serves the pre-serialized card bytes so discovery does no encoding work,
+    and answers 304 when the client already holds the current card.
     """
-    return RESUME_OPTIMIZER_AGENT_CARD.dict()
+    if request.headers.get("if-none-match") == _AGENT_CARD_ETAG:
+        return Response(status_code=304, headers=_AGENT_CARD_HEADERS)
+    return Response(
+        content=RESUME_OPTIMIZER_AGENT_CARD_BYTES,
+        media_type="application/json",
+        headers=_AGENT_CARD_HEADERS
+    )
 
 
 @app.post("/v1/message:send")
@@ -81,10 +119,8 @@ async def send_message(request: Request):
     start_time = time.time()
     
     try:
-        body = await request.json()
-        
-        # Parse JSON-RPC request
-        rpc_request = JSONRPCRequest(**body)
+        # Parse JSON-RPC request straight from the raw body
+        rpc_request = decode_jsonrpc_request(await request.body())
         
         # Handle request
         response = await jsonrpc_handler.handle_request(rpc_request)
@@ -94,7 +130,8 @@ async def send_message(request: Request):
             response.result.setdefault("metadata", {})
             response.result["metadata"]["execution_time_ms"] = int((time.time() - start_time) * 1000)
         
-        return JSONResponse(content=response.dict())
+        # Encode once with orjson; task and message timestamps stay datetimes
+        return Response(content=_dumps(response.dict()), media_type="application/json")
         
     except json.JSONDecodeError:
         return JSONResponse(
@@ -129,26 +166,25 @@ async def send_message_stream(request: Request):
     Uses Server-Sent Events (SSE) for streaming responses
     """
     try:
-        body = await request.json()
-        rpc_request = JSONRPCRequest(**body)
+        rpc_request = decode_jsonrpc_request(await request.body())
         
         async def event_generator():
             """Generate SSE events"""
             # Start event
-            yield f"data: {json.dumps({'status': 'started', 'method': rpc_request.method})}\n\n"
+            yield _sse_event({'status': 'started', 'method': rpc_request.method})
             
             # Progress updates (placeholder - implement actual progress tracking)
             for progress in [25, 50, 75]:
-                yield f"data: {json.dumps({'status': 'in_progress', 'progress': progress})}\n\n"
+                yield _sse_event({'status': 'in_progress', 'progress': progress})
             
             # Execute and get result
             response = await jsonrpc_handler.handle_request(rpc_request)
             
             # Send final result
             if response.error:
-                yield f"data: {json.dumps({'status': 'error', 'error': response.error.dict()})}\n\n"
+                yield _sse_event({'status': 'error', 'error': response.error.dict()})
             else:
-                yield f"data: {json.dumps({'status': 'completed', 'result': response.result})}\n\n"
+                yield _sse_event({'status': 'completed', 'result': response.result})
         
         return StreamingResponse(
             event_generator(),
@@ -59,13 +59,13 @@ class ProfileRAGAgent(BaseAgent):
             }
             
             if results.get('documents'):
-                for doc, metadata, distance in zip(
+                for doc, metadata, similarity in zip(
                     results.get('documents', []),
                     results.get('metadatas', []),
-                    results.get('distances', [])
+                    results.get('similarities', [])
                 ):
                     profile_data["relevant_sections"].append(doc)
-                    profile_data["similarity_scores"].append(1 / (1 + distance))
+                    profile_data["similarity_scores"].append(similarity)
                     profile_data["metadata"].append(metadata)
             
             # Store in session state
@@ -36,6 +36,7 @@ from resume_optimizer.monitoring.callbacks import (
 UPLOAD_DIR = Path("./data/uploads")
 VECTOR_DB_DIR = Path("./data/vector_db")
 OUTPUT_DIR = Path("./output")
+DOCUMENT_CACHE_PATH = Path("./data/document_cache.db")
 
 # Ensure directories exist
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -43,7 +44,7 @@ VECTOR_DB_DIR.mkdir(parents=True, exist_ok=True)
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # Initialize components
-doc_processor = DocumentProcessor()
+doc_processor = DocumentProcessor(cache_path=str(DOCUMENT_CACHE_PATH))
 vector_store = LocalVectorStore(str(VECTOR_DB_DIR))
 
 
@@ -0,0 +1,98 @@
+"""
+Tests for A2AClient skill-input validation and agent card caching
+"""
+import asyncio
+from collections import OrderedDict
+
+import httpx
+import pytest
+
+from resume_optimizer.a2a import client as client_module
+from resume_optimizer.a2a.agent_card import (
+    RESUME_OPTIMIZER_AGENT_CARD, RESUME_OPTIMIZER_AGENT_CARD_BYTES
+)
+from resume_optimizer.a2a.client import A2AClient
+
+_ETAG = '"card-v1"'
+
+
+@pytest.fixture(autouse=True)
+def empty_card_cache(monkeypatch):
+    monkeypatch.setattr(client_module, "_AGENT_CARD_CACHE", OrderedDict())
+
+
+def _client(base_url, seen_etags, validate=False):
+    """A2AClient whose requests go to an in-process agent card endpoint"""
+    def handler(request):
+        if_none_match = request.headers.get("if-none-match")
+        seen_etags.append(if_none_match)
+        if if_none_match == _ETAG:
+            return httpx.Response(304, headers={"etag": _ETAG})
+        return httpx.Response(200, content=RESUME_OPTIMIZER_AGENT_CARD_BYTES, headers={"etag": _ETAG})
+    
+    client = A2AClient(base_url, validate=validate)
+    client._client = httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_discover_agent_revalidates_with_etag():
+    seen_etags = []
+    
+    first = asyncio.run(_client("http://agent", seen_etags).discover_agent())
+    second = asyncio.run(_client("http://agent", seen_etags).discover_agent())
+    
+    assert seen_etags == [None, _ETAG]
+    assert second is first
+    assert first.id == RESUME_OPTIMIZER_AGENT_CARD.id
+
+
+def test_unvalidated_card_is_not_reused_by_validating_client():
+    seen_etags = []
+    
+    asyncio.run(_client("http://agent", seen_etags).discover_agent())
+    asyncio.run(_client("http://agent", seen_etags, validate=True).discover_agent())
+    
+    assert seen_etags == [None, None]
+
+
+def test_card_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(client_module, "_AGENT_CARD_CACHE_SIZE", 1)
+    
+    asyncio.run(_client("http://first", []).discover_agent())
+    asyncio.run(_client("http://second", []).discover_agent())
+    
+    assert list(client_module._AGENT_CARD_CACHE) == [("http://second", False)]
+
+
+def _invoke(client, skill_id, input_data):
+    """Invoke a skill and return the params passed to send_message"""
+    sent = {}
+    
+    async def send_message(**kwargs):
+        sent.update(kwargs)
+        return {}
+    
+    client.send_message = send_message
+    asyncio.run(client.invoke_skill(skill_id, input_data))
+    return sent
+
+
+def test_skill_validation_does_not_fill_in_defaults():
+    pytest.importorskip("fastjsonschema")
+    client = A2AClient("http://agent")
+    client.agent_card = RESUME_OPTIMIZER_AGENT_CARD
+    input_data = {"resume_content": "resume", "job_description": "job"}
+    
+    sent = _invoke(client, "optimize-resume", input_data)
+    
+    assert input_data == {"resume_content": "resume", "job_description": "job"}
+    assert sent["additional_params"] == {"input": input_data}
+
+
+def test_invalid_skill_input_fails_locally():
+    pytest.importorskip("fastjsonschema")
+    client = A2AClient("http://agent")
+    client.agent_card = RESUME_OPTIMIZER_AGENT_CARD
+    
+    with pytest.raises(ValueError, match="optimize-resume"):
+        _invoke(client, "optimize-resume", {"job_description": "job"})
@@ -0,0 +1,61 @@
+"""
+Tests for constructing A2A messages without full pydantic validation
+"""
+import asyncio
+
+import pytest
+
+from resume_optimizer.a2a.jsonrpc_handler import A2AJSONRPCHandler
+from resume_optimizer.a2a.messages import (
+    A2AMessage, JSONRPCErrorCode, JSONRPCRequest, construct_a2a_message
+)
+
+
+def _message(*parts):
+    return {"role": "user", "author": "tester", "parts": list(parts)}
+
+
+def test_matches_validated_message():
+    data = _message(
+        {"type": "text", "text": "hello"},
+        {"type": "tool_result", "id": "call-1", "result": {"ok": True}},
+    )
+    data["timestamp"] = "2026-01-01T00:00:00"
+    
+    assert construct_a2a_message(data).dict() == A2AMessage(**data).dict()
+
+
+def test_missing_text_raises_value_error():
+    with pytest.raises(ValueError, match="text"):
+        construct_a2a_message(_message({"type": "text"}))
+
+
+def test_missing_part_data_raises_value_error():
+    with pytest.raises(ValueError, match="result"):
+        construct_a2a_message(_message({"type": "tool_result", "id": "call-1"}))
+
+
+@pytest.mark.parametrize("data", ["hello", ["text"], None, 42])
+def test_non_dict_message_raises_value_error(data):
+    with pytest.raises(ValueError):
+        construct_a2a_message(data)
+
+
+def test_non_list_parts_raises_value_error():
+    with pytest.raises(ValueError, match="parts"):
+        construct_a2a_message({"role": "user", "author": "tester", "parts": "hello"})
+
+
+@pytest.mark.parametrize("message", [
+    _message({"type": "text"}),
+    _message("hello"),
+    "hello",
+])
+def test_message_send_reports_invalid_params(message):
+    handler = A2AJSONRPCHandler()
+    request = JSONRPCRequest(method="message/send", params={"message": message}, id=1)
+    
+    response = asyncio.run(handler.handle_request(request))
+    
+    assert response.result is None
+    assert response.error.code == JSONRPCErrorCode.INVALID_PARAMS
@@ -0,0 +1,54 @@
+"""
+Tests for the opt-in DocumentProcessor chunk cache
+"""
+from io import BytesIO
+
+from local_rag import document_processor
+from local_rag.document_processor import DocumentProcessor
+
+
+def _counting_extractor(processor, monkeypatch):
+    """Replace PDF extraction with a stub that records each call"""
+    calls = []
+    
+    def extract_text_from_pdf(pdf_file):
+        calls.append(pdf_file)
+        return "Python developer. Built data pipelines."
+    
+    monkeypatch.setattr(processor, "extract_text_from_pdf", extract_text_from_pdf)
+    return calls
+
+
+def test_cache_is_disabled_by_default(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    processor = DocumentProcessor()
+    calls = _counting_extractor(processor, monkeypatch)
+    
+    processor.process_pdf(BytesIO(b"%PDF-same"), "a.pdf")
+    processor.process_pdf(BytesIO(b"%PDF-same"), "a.pdf")
+    
+    assert len(calls) == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_repeated_pdf_is_served_from_cache(tmp_path, monkeypatch):
+    processor = DocumentProcessor(cache_path=str(tmp_path / "cache.db"))
+    calls = _counting_extractor(processor, monkeypatch)
+    
+    first = processor.process_pdf(BytesIO(b"%PDF-same"), "a.pdf")
+    second = processor.process_pdf(BytesIO(b"%PDF-same"), "b.pdf")
+    
+    assert len(calls) == 1
+    assert second[0] == first[0]
+    assert second[1][0]["filename"] == "b.pdf"
+
+
+def test_cache_is_keyed_on_extractor_version(tmp_path, monkeypatch):
+    processor = DocumentProcessor(cache_path=str(tmp_path / "cache.db"))
+    calls = _counting_extractor(processor, monkeypatch)
+    
+    processor.process_pdf(BytesIO(b"%PDF-same"), "a.pdf")
+    monkeypatch.setattr(document_processor, "_EXTRACTOR_VERSION", "next-extractor")
+    processor.process_pdf(BytesIO(b"%PDF-same"), "a.pdf")
+    
+    assert len(calls) == 2
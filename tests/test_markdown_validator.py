@@ -0,0 +1,29 @@
+"""
+Tests for the MCP server's markdown header check
+"""
+from mcp_servers.resume_tools_server import MarkdownValidatorTool
+
+
+def _header_warnings(markdown):
+    return MarkdownValidatorTool().validate_markdown(markdown)["warnings"]
+
+
+def test_header_without_space_is_flagged():
+    assert _header_warnings("# Title\n##Bad\n") == ["Line 2: Header should have space after #"]
+
+
+def test_valid_headers_are_not_flagged():
+    assert _header_warnings("# Title\n## Section\n### Sub section\n") == []
+
+
+def test_bare_header_marker_is_not_flagged():
+    assert _header_warnings("# Title\n##\n") == []
+
+
+def test_crlf_input():
+    markdown = "# Title\r\n##\r\n##Bad\r\n## Good\r\n"
+    
+    result = MarkdownValidatorTool().validate_markdown(markdown)
+    
+    assert result["warnings"] == ["Line 3: Header should have space after #"]
+    assert result["line_numbers"] == [3]
@@ -0,0 +1,50 @@
+"""
+Tests for TaskStore LRU and TTL eviction
+"""
+from resume_optimizer.a2a.jsonrpc_handler import TaskStore
+
+
+def test_least_recently_used_finished_task_is_evicted():
+    store = TaskStore(maxsize=2)
+    store["a"] = "task-a"
+    store["b"] = "task-b"
+    store.mark_finished("a")
+    store.mark_finished("b")
+    
+    store["a"]  # touch, so "b" becomes least recently used
+    store["c"] = "task-c"
+    
+    assert "a" in store
+    assert "b" not in store
+    assert "c" in store
+
+
+def test_unfinished_tasks_are_never_evicted():
+    store = TaskStore(maxsize=1)
+    store["a"] = "task-a"
+    store["b"] = "task-b"
+    
+    assert len(store) == 2
+
+
+def test_finished_tasks_expire_after_ttl():
+    store = TaskStore(ttl=0)
+    store["a"] = "task-a"
+    store["b"] = "task-b"
+    store.mark_finished("a")
+    
+    store["c"] = "task-c"
+    
+    assert "a" not in store
+    assert "b" in store
+    assert "c" in store
+
+
+def test_newest_first_ignores_lru_order():
+    store = TaskStore()
+    for task_id in ("a", "b", "c"):
+        store[task_id] = f"task-{task_id}"
+    
+    store["a"]
+    
+    assert list(store.newest_first()) == ["task-c", "task-b", "task-a"]
@@ -0,0 +1,36 @@
+"""
+Tests for converting ChromaDB distances to similarities
+"""
+import pytest
+
+from local_rag.vector_store import LocalVectorStore
+
+
+def _raw_results(distances):
+    return {
+        "documents": [[f"doc-{i}" for i in range(len(distances))]],
+        "metadatas": [[{} for _ in distances]],
+        "distances": [distances],
+        "ids": [[f"id-{i}" for i in range(len(distances))]]
+    }
+
+
+def test_cosine_distance_similarity():
+    results = LocalVectorStore._filter_results(_raw_results([0.2, 0.6]), 0, 0.5)
+    
+    assert results["ids"] == ["id-0"]
+    assert results["similarities"] == pytest.approx([0.8])
+
+
+def test_legacy_l2_distance_similarity():
+    results = LocalVectorStore._filter_results(_raw_results([0.5, 1.5]), 0, 0.5, "l2")
+    
+    assert results["ids"] == ["id-0"]
+    assert results["similarities"] == pytest.approx([1 / 1.5])
+
+
+def test_l2_similarities_are_never_negative():
+    results = LocalVectorStore._filter_results(_raw_results([1.5, 4.0]), 0, 0.0, "l2")
+    
+    assert results["ids"] == ["id-0", "id-1"]
+    assert min(results["similarities"]) > 0